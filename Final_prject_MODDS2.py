@@ -1,58 +1,451 @@
-from sympy.physics.continuum_mechanics.beam import Beam
-from sympy import symbols
 from PyQt5 import QtGui
-from PyQt5.QtWidgets import QLineEdit,QApplication,QLabel,QMainWindow,QPushButton,QVBoxLayout,QWidget,QHBoxLayout,QGroupBox,QRadioButton
+from PyQt5.QtWidgets import QLineEdit,QApplication,QLabel,QMainWindow,QPushButton,QVBoxLayout,QWidget,QHBoxLayout,QGroupBox,QRadioButton,QButtonGroup,QFormLayout
 from PyQt5.QtGui import QIcon, QFont,QImage, QPalette, QBrush
 from PyQt5.QtCore import QSize
+import hashlib
+import os
+import pickle
 import sys
+import threading
+import importlib
+from collections import deque
+from dataclasses import dataclass, astuple
+from functools import lru_cache, wraps
+from math import comb
+import numpy as np
+
+## numba is optional and imported on the first call of a compiled function,
+## without it the functions stay plain Python
+
+def njit(**options):
+    def decorate(f):
+        compiled = None
+        @wraps(f)
+        def call(*args):
+            nonlocal compiled
+            if compiled is None:
+                try:
+                    compiled = importlib.import_module('numba').njit(**options)(f)
+                except ImportError:
+                    compiled = f
+            return compiled(*args)
+        return call
+    return decorate
+
+## sympy is imported on the first solve only, entering inputs never pays for it
+
+_sympy = None                 ## the sympy module once load_sympy() has run
+Beam = None
+X = None                      ## beam variable shared by every Beam and expression
+
+def load_sympy():
+    global _sympy, Beam, X
+    if _sympy is None:
+        _sympy = importlib.import_module('sympy')
+        Beam = importlib.import_module('sympy.physics.continuum_mechanics.beam').Beam
+        X = _sympy.symbols('x')
+    return _sympy
+
+# Inputs are stored in typed records, one list per kind of input
+
+@dataclass(slots=True)
+class Support:
+    type: str                  ## "pin", "fixed" or "roller"
+    pos: float = None
+
+@dataclass(slots=True)
+class PointLoad:
+    sign: int                  ## +1 for upward, -1 for downward
+    pos: float
+    mag: float
+
+    def load(self):
+        ## (value, start, order, end) as taken by Beam.apply_load, beams take downward loads as positive
+        return -self.sign*self.mag, self.pos, -1, None
+
+@dataclass(slots=True)
+class DistLoad:
+    sign: int                  ## +1 for upward, -1 for downward
+    start: float
+    end: float
+    start_mag: float
+    end_mag: float
+
+    def load(self):
+        start, end = self.start, self.end
+        if self.start_mag == self.end_mag:                    ## uniform load
+            value, order = self.start_mag, 0
+        elif self.start_mag == 0:                             ## ramp rising towards the end
+            value, order = self.end_mag, 1
+        elif self.end_mag == 0:                               ## ramp falling towards the end
+            value, order = self.start_mag, 1
+            start, end = end, start
+        else:
+            return None
+        return -self.sign*value, start, order, end
+
+@dataclass(slots=True)
+class Moment:
+    dir: int                   ## +1 for counter clockwise, -1 for clockwise
+    pos: float
+    mag: float
+
+    def load(self):
+        ## + sign for counter clockwise and - for clockwise moment
+        return self.dir*self.mag, self.pos, -2, None
+
+beam_inputs={}                 ## length, counts, section geometry and E
+supports=[]
+unplaced_supports=deque()      ## supports still waiting for their place, in input order
+point_loads=[]
+dist_loads=[]
+moments=[]
+units=['m','m','N','N']       ## length in, length out, force in, force out
+
+def as_key(records):
+    ## hashable copy of a list of records, used to look up already solved beams
+    return tuple(astuple(r) for r in records)
+
+def remove_record(records, record):
+    ## drop this exact record, equal looking records entered elsewhere are kept
+    for i in range(len(records) - 1, -1, -1):
+        if records[i] is record:
+            del records[i]
+            return
+
+## the count prompts give how many supports and loads of each kind are entered
+
+COUNTED = {'supports': (supports, 'supports'), 'pointloads': (point_loads, 'point loads'),
+           'distloads': (dist_loads, 'distributed loads'), 'moments': (moments, 'moments')}
+
+def room_for(key):
+    ## False, with a message, once all the announced rows of this kind are entered
+    records, name = COUNTED[key]
+    count = beam_inputs.get(key)
+    if count is not None and len(records) >= count:
+        print(f"all {count} {name} have already been entered")
+        return False
+    return True
+
+def check_counts():
+    ## stop before solving when fewer rows were entered than announced
+    for key, (records, name) in COUNTED.items():
+        count = beam_inputs.get(key)
+        if count is not None and len(records) != count:
+            sys.exit(f"{count} {name} were announced but {len(records)} were entered")
+
+## convert units
 
-# Inputs are stored in
+_SI = {'mm': 0.001, 'm': 1.0, 'ft': 0.3048, 'in': 0.0254}
+_FORCE = {'N': 1.0, 'KN': 1000.0, 'lb': 4.448, 'kip': 4448.2216}
 
-listofinputs=[]
-units=[]
+## conversion factors for every (unit_in, unit_out) pair, built once at import as
+## matrices indexed by unit id, so a batch sharing one pair is a single array multiply
 
-## convert units
+LEN_UNITS = ['mm', 'm', 'ft', 'in']
+LEN_ID = {u: i for i, u in enumerate(LEN_UNITS)}
+FORCE_UNITS = ['N', 'KN', 'lb', 'kip']
+FORCE_ID = {u: i for i, u in enumerate(FORCE_UNITS)}
+
+LEN_FACTOR = np.array([[_SI[a]/_SI[b] for b in LEN_UNITS] for a in LEN_UNITS])
+FORCE_FACTOR = np.array([[_FORCE[a]/_FORCE[b] for b in FORCE_UNITS] for a in FORCE_UNITS])
+I_FACTOR = LEN_FACTOR**4
+
+## moment and distributed load factors indexed by (force_in, force_out, len_in, len_out):
+## 4x4x4x4 = 256 floats per table (~2 KB), so each conversion is one lookup and one multiply
+
+MOMENT_FACTOR = FORCE_FACTOR[:, :, None, None]*LEN_FACTOR[None, None, :, :]
+DIST_FACTOR = FORCE_FACTOR[:, :, None, None]/LEN_FACTOR[None, None, :, :]
 
+@lru_cache(maxsize=512)
 def convert_len(val, unit_in, unit_out):
-    SI = { 'mm':0.001, 'm':1.0, 'ft':0.3048,'in':0.0254}
-    return round(val*SI[unit_in]/SI[unit_out],4)
+    return val*float(LEN_FACTOR[LEN_ID[unit_in], LEN_ID[unit_out]])
 
+@lru_cache(maxsize=512)
 def convert_force(val, unit_in, unit_out):
-    force = {'N':1.0,'KN':1000.0,'lb':4.448,'kip':4448.2216}
-    return round(val*force[unit_in]/force[unit_out],4)
+    return val*float(FORCE_FACTOR[FORCE_ID[unit_in], FORCE_ID[unit_out]])
 
+@lru_cache(maxsize=512)
 def convert_moment(val, unitf_in, unitf_out,unitl_in, unitl_out):
-    force = {'N':1.0,'KN':1000.0,'lb':4.448,'kip':4448.2216}
-    SI = {'mm': 0.001, 'm': 1.0, 'ft': 0.3048, 'in': 0.0254}
-    return round((val * force[unitf_in] / force[unitf_out])*(SI[unitl_in]/SI[unitl_out]),4)
+    return val*float(MOMENT_FACTOR[FORCE_ID[unitf_in], FORCE_ID[unitf_out], LEN_ID[unitl_in], LEN_ID[unitl_out]])
 
+@lru_cache(maxsize=512)
 def convert_dist(val, unitf_in, unitf_out,unitl_in, unitl_out):
-    force = {'N':1.0,'KN':1000.0,'lb':4.448,'kip':4448.2216}
-    SI = {'mm': 0.001, 'm': 1.0, 'ft': 0.3048, 'in': 0.0254}
-    return round((val * force[unitf_in] / force[unitf_out])/(SI[unitl_in]/SI[unitl_out]),4)
+    return val*float(DIST_FACTOR[FORCE_ID[unitf_in], FORCE_ID[unitf_out], LEN_ID[unitl_in], LEN_ID[unitl_out]])
 
+@lru_cache(maxsize=512)
 def convert_I(val, unit_in, unit_out):
-    SI = { 'mm':0.001, 'm':1.0, 'ft':0.3048,'in':0.0254}
-    return round(val*SI[unit_in]**4/SI[unit_out]**4,4)
+    return val*float(I_FACTOR[LEN_ID[unit_in], LEN_ID[unit_out]])
+
+def convert_batch(texts, factor):
+    ## convert several entries sharing one unit pair with a single multiply
+    return (np.array([float(t) for t in texts])*factor).tolist()
+
+def clear_unit_caches():
+    for f in (convert_len, convert_force, convert_moment, convert_dist, convert_I):
+        f.cache_clear()
 
 ## Calculate moment of inertia
 
+@njit(cache=True, fastmath=True)
 def MomentOfInertia(bf1,tf1,d,tw,bf2,tf2):
-    sigmaa = bf1 * tf1 + d * tw + tf2 * bf2
-    ybar = (tf1 / 2 * bf1 * tf1 + (d / 2 + tf1) * d * tw + (d + tf1 + tf2 / 2) * tf2 * bf2) / sigmaa
-    ix = 1 / 12 * bf1 * tf1 ** 3 + (ybar - tf1 / 2) ** 2 * (bf1 * tf1) + 1 / 12 * d ** 3 * tw + (
-                ybar - (d / 2 + tf1)) ** 2 * d * tw + 1 / 12 * bf2 * tf2 ** 3 + bf2 * tf2 * (
-                     ybar - (d + tf1 + tf2 / 2)) ** 2
+    ## areas and centroid heights of bottom flange, web and top flange
+    A1 = bf1 * tf1
+    A2 = d * tw
+    A3 = bf2 * tf2
+    y1 = tf1 / 2
+    y2 = d / 2 + tf1
+    y3 = d + tf1 + tf2 / 2
+    sigmaa = A1 + A2 + A3
+    ybar = (y1 * A1 + y2 * A2 + y3 * A3) / sigmaa
+    ix = bf1 * tf1 ** 3 / 12 + A1 * (ybar - y1) ** 2 + d ** 3 * tw / 12 + A2 * (ybar - y2) ** 2 \
+         + bf2 * tf2 ** 3 / 12 + A3 * (ybar - y3) ** 2
     return ix
 
+## Build and solve the beam, identical inputs reuse the solved beams
+
+def copy_loads(beam, sign):
+    ## new beam carrying sign times the loads of beam, without applying them one by one
+    new = Beam(beam.length, beam.elastic_modulus, beam.second_moment, variable=X)
+    new._load = sign*beam._load
+    new._original_load = sign*beam._original_load
+    new._applied_loads = [(sign*value, start, order, end) for value, start, order, end in beam._applied_loads]
+    return new
+
+## solved reactions, deflection and slope are also kept on disk, keyed by a hash of the inputs,
+## so running the same beam again skips the symbolic solve
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'beam_deflection')
+## bump whenever the solver or the stored format changes, so older entries are no longer found
+CACHE_FORMAT = 2
+
+def cache_path(*inputs):
+    key = hashlib.blake2b(repr((CACHE_FORMAT, _sympy.__version__) + inputs).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, key + '.pkl')
+
+def read_solution(path):
+    ## (reactions, deflection, slope) or None when the beam was not solved before
+    try:
+        with open(path, 'rb') as file:
+            sources = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        sources = None
+    try:
+        reactions, deflection, slope = sources
+        return [_sympy.sympify(r) for r in reactions], _sympy.sympify(deflection), _sympy.sympify(slope)
+    except Exception:
+        ## a truncated or edited entry is a miss, remove it so the solve writes it again
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+def write_solution(path, reactions, deflection, slope):
+    ## stored as srepr strings, they read back exactly and do not depend on sympy's pickle format
+    sources = ([_sympy.srepr(r) for r in reactions], _sympy.srepr(deflection), _sympy.srepr(slope))
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, 'wb') as file:
+            pickle.dump(sources, file)
+    except OSError:
+        pass
+
+def apply_loads(beam, loads):
+    ## same as calling beam.apply_load for every load, but the singularity terms
+    ## are collected first and added to the load expression with a single Add
+    SingularityFunction = _sympy.SingularityFunction
+    terms = []
+    for value, start, order, end in loads:
+        value, start, order = _sympy.sympify(value), _sympy.sympify(start), int(order)
+        beam._applied_loads.append((value, start, _sympy.Integer(order), end))
+        terms.append(value*SingularityFunction(X, start, order))
+        if end is not None:
+            ## cancel the load past its end, the Taylor terms of Beam._handle_end in closed form
+            end = _sympy.sympify(end)
+            for i in range(order + 1):
+                terms.append(-value*comb(order, i)*(end - start)**(order - i)*SingularityFunction(X, end, i))
+    load = _sympy.Add(*terms)
+    beam._load += load
+    beam._original_load += load
+
+## supports and unknown reactions, looked up by the number of supports;
+## beams is (b, diagram, diagram2), only b draws the supports and only diagram2 needs boundary conditions
+
+def apply_two_supports(support_rows, beams, R1, R2):
+    (sup_1, sup_1_place), (sup_2, sup_2_place) = support_rows
+    beams[0].apply_support(sup_1_place, sup_1)
+    beams[0].apply_support(sup_2_place, sup_2)
+    for beam in beams:
+        beam.apply_load(R1, sup_1_place, -1)
+        beam.apply_load(R2, sup_2_place, -1)
+    beams[2].bc_deflection = [(sup_1_place, 0), (sup_2_place, 0)]
+
+def apply_one_support(support_rows, beams, R1, R2):
+    ## a single support has to be fixed, R1 is its moment and R2 its force
+    (sup_1, sup_1_place), = support_rows
+    beams[0].apply_support(sup_1_place, sup_1)
+    for beam in beams:
+        beam.apply_load(R1, sup_1_place, -2)
+        beam.apply_load(R2, sup_1_place, -1)
+    beams[2].bc_deflection = [(sup_1_place, 0)]
+    beams[2].bc_slope = [(sup_1_place, 0)]
+
+SUPPORT_HANDLERS = {1: apply_one_support, 2: apply_two_supports}
+
+@lru_cache(maxsize=8)
+def solve_beam(length, E, I, support_rows, point_rows, dist_rows, moment_rows):
+    sympy = load_sympy()
+    ## Reaction forces or moment (unknown)
+    R1, R2 = sympy.symbols('R1, R2')
+    ## only the product EI enters the solution, pass it as one plain float
+    EI = float(E)*1e9*float(I)
+    ## b for drawing the beam
+    b = Beam(length, EI, 1.0, variable=X)
+
+    ## make inputs productive
+    ## loads are applied to b only, with downward loads as positive
+    loads = [record_type(*row).load()
+             for rows, record_type in ((point_rows, PointLoad), (dist_rows, DistLoad), (moment_rows, Moment))
+             for row in rows]
+    apply_loads(b, [load for load in loads if load is not None])
+
+    ## diagram for bmd and sfd plots has the loads of b,
+    ## diagram2 for deflection and slope takes upward loads as positive
+    diagram = copy_loads(b, 1)
+    diagram2 = copy_loads(b, -1)
+
+    handler = SUPPORT_HANDLERS.get(len(support_rows))
+    if handler:
+        handler(support_rows, (b, diagram, diagram2), R1, R2)
+
+    ## solve once, diagram has every load negated so its reactions are the negated ones
+    path = cache_path(length, E, I, support_rows, point_rows, dist_rows, moment_rows)
+    solution = read_solution(path)
+    if solution is None:
+        diagram2.solve_for_reaction_loads(R1, R2)
+        reactions = [diagram2.reaction_loads[R1], diagram2.reaction_loads[R2]]
+        deflection, slope = diagram2.deflection(), diagram2.slope()
+        write_solution(path, reactions, deflection, slope)
+    else:
+        reactions, deflection, slope = solution
+        diagram2._reaction_loads = dict(zip((R1, R2), reactions))
+        diagram2._load = diagram2._load.subs(diagram2._reaction_loads)
+    diagram._reaction_loads = {R1: -reactions[0], R2: -reactions[1]}
+    diagram._load = diagram._load.subs(diagram._reaction_loads)
+    return b, diagram, diagram2, deflection, slope
+
+## Sample all solved curves along the beam in one call instead of one subs per point
+
+def sample_curves(exprs, length, n=512):
+    ## one lambdified function returns every curve, cse shares the singularity terms between them
+    sympy = load_sympy()
+    xs = np.linspace(0, float(length), n)
+    exprs = tuple(expr.rewrite(sympy.Piecewise) for expr in exprs)        ## singularity functions as plain if/else
+    ## the curves are sampled once per run, compiling them would cost more than it saves
+    ys = sympy.lambdify(X, exprs, 'numpy', cse=True)(xs)
+    return xs, np.array([np.broadcast_to(y, xs.shape) for y in ys])
+
+## Point queries evaluate the singularity terms directly, compiled when numba is installed
+
+@njit(cache=True)
+def eval_singularity(xs, coeffs, starts, orders):
+    ys = np.zeros_like(xs)
+    for i in range(xs.size):
+        total = 0.0
+        for k in range(coeffs.size):
+            d = xs[i] - starts[k]
+            if d >= 0 and orders[k] >= 0:
+                total += coeffs[k] * d ** orders[k]
+        ys[i] = total
+    return ys
+
+def singularity_terms(expr):
+    ## coefficient, start and order arrays of expr as a sum of coeff*<x-a>^n,
+    ## polynomial terms are <x-0>^n on the beam; None if expr has any other kind of term
+    coeffs, starts, orders = [], [], []
+    for term in _sympy.Add.make_args(expr):
+        coeff, rest = term.as_independent(X, as_Add=False)
+        if rest == 1:
+            start, order = 0, 0
+        elif rest == X:
+            start, order = 0, 1
+        elif rest.is_Pow and rest.base == X and rest.exp.is_Integer and rest.exp > 0:
+            start, order = 0, rest.exp
+        elif isinstance(rest, _sympy.SingularityFunction) and rest.args[0] == X and rest.args[1].is_number:
+            start, order = rest.args[1], rest.args[2]
+        else:
+            return None
+        coeffs.append(float(coeff))
+        starts.append(float(start))
+        orders.append(int(order))
+    return np.array(coeffs), np.array(starts), np.array(orders, dtype=np.int64)
+
+def singularity_fn(expr):
+    ## function of x (a number or an array) evaluating expr
+    terms = singularity_terms(expr)
+    if terms is None:
+        ## functions numpy has no version of fall back to sympy's own definition
+        return _sympy.lambdify(X, expr, modules=['numpy', 'sympy'])
+    def f(x):
+        ys = eval_singularity(np.atleast_1d(np.asarray(x, dtype=float)), *terms)
+        return ys[0] if np.ndim(x) == 0 else ys
+    return f
+
+def plot_curves(curves):
+    ## all result curves in one 2x2 figure, matplotlib is imported only when plotting
+    import matplotlib.pyplot as plt
+    fig, axes = plt.subplots(2, 2)
+    for ax, (xs, ys, title, ylabel, color) in zip(axes.flat, curves):
+        ax.plot(xs, ys, color=color)
+        ax.set_title(title)
+        ax.set_xlabel('x')
+        ax.set_ylabel(ylabel)
+    fig.tight_layout()
+    plt.show()
+
 ## working with PYQT5
 
+## fonts are set once on the application, group box titles are one point larger
+
+APP_FONT = QFont("Sanserif", 14)
+APP_STYLE = "QGroupBox { font-size: 15pt; }"
+
+## icons and images are read from disk once and shared between windows
+
+_ICON_CACHE = {}
+_IMAGE_CACHE = {}
+
+def icon(path):
+    if path not in _ICON_CACHE:
+        _ICON_CACHE[path] = QIcon(path)
+    return _ICON_CACHE[path]
+
+def image(path):
+    if path not in _IMAGE_CACHE:
+        _IMAGE_CACHE[path] = QImage(path)
+    return _IMAGE_CACHE[path]
+
+def add_input_row(form, text, slot, width=130):
+    ## one "label: textbox OK" row of a form, the OK button calls slot
+    line = QLineEdit()
+    line.setFixedWidth(width)
+    button = QPushButton('OK')
+    button.clicked.connect(slot)
+    hbox = QHBoxLayout()
+    hbox.addWidget(line)
+    hbox.addWidget(button)
+    form.addRow(text, hbox)
+    return line
+
 class Main_Window(QWidget):
     def __init__(self):
        QWidget.__init__(self)
        self.setGeometry(100,100,400,400)
        button = QPushButton('Continue')
-       oImage = QImage("beam.jpg")
+       oImage = image("beam.jpg")
        sImage = oImage.scaled(QSize(400,400))                   # resize Image to widgets size
        palette = QPalette()
        palette.setBrush(QPalette.Window, QBrush(sImage))
@@ -65,17 +458,21 @@ class Main_Window(QWidget):
        self.label.setGeometry(90, 50, 300, 50)
        self.setWindowTitle('Title')
 
-class AnotherWindow1(QWidget):
+class NumericPrompt(QWidget):
 
-    def __init__(self):
+    ## one window for every "label + textbox + OK" input (beam length, number of supports/loads/moments)
+
+    def __init__(self, label_text, title, key, converter=int):
         super().__init__()
+        self.key = key
+        self.converter = converter
 
-        self.initUI()
+        self.initUI(label_text, title)
 
 
-    def initUI(self):
+    def initUI(self, label_text, title):
 
-        label = QLabel('please enter the length of the beam:')
+        label = QLabel(label_text)
         button = QPushButton('OK')
         self.textbox = QLineEdit()
         hbox = QHBoxLayout()
@@ -92,159 +489,20 @@ class AnotherWindow1(QWidget):
         self.setLayout(vbox)
 
         self.setGeometry(300, 300, 300, 220)
-        self.setWindowTitle('Add beam')
+        self.setWindowTitle(title)
 
 ##connecting buttons to function to make them productive
 
     def button_clicked(self):
-        print("Length:" +self.textbox.text())
-        l=convert_len(float(self.textbox.text()),units[0],units[1])
-        listofinputs.append(l)
-        self.hide()
-
-class AnotherWindow2(QWidget):
-
-    def __init__(self):
-        super().__init__()
-
-        self.initUI()
-
-
-    def initUI(self):
-
-        label = QLabel('please enter the number of supports:')
-        button = QPushButton('OK')
-        self.textbox = QLineEdit()
-        hbox = QHBoxLayout()
-        hbox.addWidget(label)
-        hbox.addWidget(self.textbox)
-        hbox.addWidget(button)
-
-        vbox = QVBoxLayout()
-        vbox.addLayout(hbox)
-        vbox.addStretch(1)
-
-        button.clicked.connect(self.button_clicked2)
-
-        self.setLayout(vbox)
-
-        self.setGeometry(300, 300, 300, 220)
-        self.setWindowTitle('number of supports')
-
-    def button_clicked2(self):
-        listofinputs.append(int(self.textbox.text()))             ## add input to the list
-        self.hide()
-        print("Number of supports:"+self.textbox.text())
-
-class AnotherWindow6(QWidget):
-
-    def __init__(self):
-        super().__init__()
-
-        self.initUI()
-
-
-    def initUI(self):
-
-        label = QLabel('please enter the number of Point Loads:')
-        button = QPushButton('OK')
-        self.textbox = QLineEdit()
-        hbox = QHBoxLayout()
-        hbox.addWidget(label)
-        hbox.addWidget(self.textbox)
-        hbox.addWidget(button)
-
-        vbox = QVBoxLayout()
-        vbox.addLayout(hbox)
-        vbox.addStretch(1)
-
-        button.clicked.connect(self.button_clicked2)
-
-        self.setLayout(vbox)
-
-        self.setGeometry(300, 300, 300, 220)
-        self.setWindowTitle('number of point loads')
-
-    def button_clicked2(self):
-        listofinputs.append("pointload")
-        listofinputs.append(int(self.textbox.text()))      ## add input to the list
-        print("Number of point lpads:"+ self.textbox.text())
-        self.hide()
-
-class AnotherWindow8(QWidget):
-
-    def __init__(self):
-        super().__init__()
-
-        self.initUI()
-
-
-    def initUI(self):
-
-        label = QLabel('please enter the number of Distributed Loads:')
-        button = QPushButton('OK')
-        self.textbox = QLineEdit()
-        hbox = QHBoxLayout()
-        hbox.addWidget(label)
-        hbox.addWidget(self.textbox)
-        hbox.addWidget(button)
-
-        vbox = QVBoxLayout()
-        vbox.addLayout(hbox)
-        vbox.addStretch(1)
-
-        button.clicked.connect(self.button_clicked2)
-
-        self.setLayout(vbox)
-
-        self.setGeometry(300, 300, 300, 220)
-        self.setWindowTitle('number of distributed loads')
-
-    def button_clicked2(self):
-        listofinputs.append("distload")
-        listofinputs.append(int(self.textbox.text()))
-        self.hide()
-        print("Number of distributed loads:"+ self.textbox.text())
-
-class AnotherWindow10(QWidget):
-
-    def __init__(self):
-        super().__init__()
-
-        self.initUI()
-
-
-    def initUI(self):
-
-        label = QLabel('please enter the number of Moments:')
-        button = QPushButton('OK')
-        self.textbox = QLineEdit()
-        hbox = QHBoxLayout()
-        hbox.addWidget(label)
-        hbox.addWidget(self.textbox)
-        hbox.addWidget(button)
-
-        vbox = QVBoxLayout()
-        vbox.addLayout(hbox)
-        vbox.addStretch(1)
-
-        button.clicked.connect(self.button_clicked2)
-
-        self.setLayout(vbox)
-
-        self.setGeometry(300, 300, 300, 220)
-        self.setWindowTitle('number of Moments')
-
-    def button_clicked2(self):
-        listofinputs.append("moment")
-        listofinputs.append(int(self.textbox.text()))
+        beam_inputs[self.key] = self.converter(self.textbox.text())      ## add input to the beam inputs
+        print(self.windowTitle() + ":" + self.textbox.text())
         self.hide()
-        print("Number of moments:"+self.textbox.text())
 
 class AnotherWindow3(QWidget):
     def __init__(self):
         super().__init__()
 
+        self._entries = []      ## supports added from this window, newest last
         #winow requirement
         self.setGeometry(200,200, 400,300)
         #our method call
@@ -254,7 +512,6 @@ class AnotherWindow3(QWidget):
         vbox.addWidget(self.groupbox)
         #this is our label
         self.label = QLabel("")
-        self.label.setFont(QFont("Sanserif", 14))
         #add your widgets in the vbox layout
         vbox.addWidget(self.label)
         #set your main window layout
@@ -268,50 +525,58 @@ class AnotherWindow3(QWidget):
 
         #this is our groupbox
         self.groupbox = QGroupBox("choose the support types ")
-        self.groupbox.setFont(QFont("Sanserif", 15))
 
 
         #this is hbox layout
         hbox = QHBoxLayout()
 
+        #one group so a click emits a single signal with the id of the chosen button
+        self.group = QButtonGroup(self)
+        self.group.idClicked.connect(self.on_selected)
+
         #these are the radiobuttons
         self.rad1 = QRadioButton("pin")
         self.rad1.setChecked(True)
-        self.rad1.setIcon(QIcon('pin.png'))
+        self.rad1.setIcon(icon('pin.png'))
         self.rad1.setIconSize(QSize(40,40))
-        self.rad1.setFont(QFont("Sanserif", 14))
-        self.rad1.toggled.connect(self.on_selected)
+        self.group.addButton(self.rad1, 0)
         hbox.addWidget(self.rad1)
 
         self.rad2 = QRadioButton("fixed")
-        self.rad2.setIcon(QIcon('fixed.jpg'))
+        self.rad2.setIcon(icon('fixed.jpg'))
         self.rad2.setIconSize(QSize(40, 40))
-        self.rad2.setFont(QFont("Sanserif", 14))
-        self.rad2.toggled.connect(self.on_selected)
+        self.group.addButton(self.rad2, 1)
         hbox.addWidget(self.rad2)
 
         self.rad3 = QRadioButton("roller")
-        self.rad3.setIcon(QIcon('roller.png'))
+        self.rad3.setIcon(icon('roller.png'))
         self.rad3.setIconSize(QSize(40, 40))
-        self.rad3.setFont(QFont("Sanserif", 14))
-        self.rad3.toggled.connect(self.on_selected)
+        self.group.addButton(self.rad3, 2)
         hbox.addWidget(self.rad3)
         self.groupbox.setLayout(hbox)
 
-    #method or slot for the toggled signal
+    #method or slot for the idClicked signal
 
-    def on_selected(self):
-        radio_button = self.sender()
-        if radio_button.isChecked():
-            self.label.setText("the support type : " + radio_button.text())
-            s=str(radio_button.text())
-            listofinputs.append(s)
+    def on_selected(self, i):
+        radio_button = self.group.button(i)
+        self.label.setText("the support type : " + radio_button.text())
+        s=str(radio_button.text())
+        if not room_for('supports'):
+            return
+        support = Support(s)
+        self._entries.append(support)
+        supports.append(support)
+        unplaced_supports.append(support)
 
     ##undo button function
 
     def undo(self):
-        print(listofinputs[-1] +" has been removed")
-        listofinputs.pop(-1)     ## remove the last element of the list
+        if not self._entries:
+            return
+        support = self._entries.pop()     ## remove the last support added here
+        remove_record(supports, support)
+        remove_record(unplaced_supports, support)
+        print(support.type +" has been removed")
 
 class AnotherWindow4(QWidget):
 
@@ -333,7 +598,6 @@ class AnotherWindow4(QWidget):
         vbox.addLayout(hbox)
         vbox.addStretch(1)
         self.label = QLabel("")
-        self.label.setFont(QFont("Sanserif", 14))
         #add your widgets in the vbox layout
         vbox.addWidget(self.label)
         button1.clicked.connect(self.button1_clicked)
@@ -345,8 +609,9 @@ class AnotherWindow4(QWidget):
 
     def button1_clicked(self):
         l=convert_len(float(self.textbox.text()),units[0],units[1])             ## usage of convert functions
-        listofinputs.append(l)
-        print("place:"+self.textbox.text())
+        if unplaced_supports:                   ## places are given in the same order as the types
+            unplaced_supports.popleft().pos = l
+        print(f"place:{self.textbox.text()} = {l:.4f}{units[1]}")      ## values keep full precision, round for display only
 
 class AnotherWindow5(QWidget):
     def __init__(self):
@@ -364,840 +629,458 @@ class AnotherWindow5(QWidget):
         vbox.addWidget(self.groupbox4)
         #this is our label
         self.label = QLabel("")
-        self.label.setFont(QFont("Sanserif", 14))
         #add your widgets in the vbox layout
         vbox.addWidget(self.label)
         #set your main window layout
         self.setLayout(vbox)
-        but = QPushButton('Undo', self)
-        but.clicked.connect(self.undo)
-        but.resize(130, 20)
-        but.move(200, 320)
 
     def create_radiobutton(self):
 
         #this is our groupbox
         self.groupbox1 = QGroupBox("choose your input unit for lenght")
-        self.groupbox1.setFont(QFont("Sanserif", 15))
 
         #this is hbox layout
         hbox1 = QHBoxLayout()
+        self.group1 = QButtonGroup(self)
+        self.group1.idClicked.connect(self.on_selected)
 
         #these are the radiobuttons
         self.rad1 = QRadioButton("m")
         self.rad1.setChecked(True)
-        self.rad1.setFont(QFont("Sanserif", 14))
-        self.rad1.toggled.connect(self.on_selected)
+        self.group1.addButton(self.rad1, 0)
         hbox1.addWidget(self.rad1)
 
         self.rad2 = QRadioButton("ft")
-        self.rad2.setFont(QFont("Sanserif", 14))
-        self.rad2.toggled.connect(self.on_selected)
+        self.group1.addButton(self.rad2, 1)
         hbox1.addWidget(self.rad2)
 
         self.rad3 = QRadioButton("in")
-        self.rad3.setFont(QFont("Sanserif", 14))
-        self.rad3.toggled.connect(self.on_selected)
+        self.group1.addButton(self.rad3, 2)
         hbox1.addWidget(self.rad3)
         self.groupbox1.setLayout(hbox1)
 
         self.rad4 = QRadioButton("mm")
-        self.rad4.setFont(QFont("Sanserif", 14))
-        self.rad4.toggled.connect(self.on_selected)
+        self.group1.addButton(self.rad4, 3)
         hbox1.addWidget(self.rad4)
         self.groupbox1.setLayout(hbox1)
 
         self.groupbox2 = QGroupBox("choose your output unit for lenght")
-        self.groupbox2.setFont(QFont("Sanserif", 15))
         hbox2 = QHBoxLayout()
+        self.group2 = QButtonGroup(self)
+        self.group2.idClicked.connect(self.on_selected)
         self.rad21 = QRadioButton("m")
         self.rad21.setChecked(True)
-        self.rad21.setFont(QFont("Sanserif", 14))
-        self.rad21.toggled.connect(self.on_selected)
+        self.group2.addButton(self.rad21, 0)
         hbox2.addWidget(self.rad21)
 
         self.rad22 = QRadioButton("ft")
-        self.rad22.setFont(QFont("Sanserif", 14))
-        self.rad22.toggled.connect(self.on_selected)
+        self.group2.addButton(self.rad22, 1)
         hbox2.addWidget(self.rad22)
 
         self.rad23 = QRadioButton("in")
-        self.rad23.setFont(QFont("Sanserif", 14))
-        self.rad23.toggled.connect(self.on_selected)
+        self.group2.addButton(self.rad23, 2)
         hbox2.addWidget(self.rad23)
         self.groupbox2.setLayout(hbox2)
 
         self.rad24 = QRadioButton("mm")
-        self.rad24.setFont(QFont("Sanserif", 14))
-        self.rad24.toggled.connect(self.on_selected)
+        self.group2.addButton(self.rad24, 3)
         hbox2.addWidget(self.rad24)
         self.groupbox2.setLayout(hbox2)
 
         self.groupbox3 = QGroupBox("choose your input unit for Force")
-        self.groupbox3.setFont(QFont("Sanserif", 15))
         hbox3 = QHBoxLayout()
+        self.group3 = QButtonGroup(self)
+        self.group3.idClicked.connect(self.on_selected)
         self.rad31 = QRadioButton("N")
         self.rad31.setChecked(True)
-        self.rad31.setFont(QFont("Sanserif", 14))
-        self.rad31.toggled.connect(self.on_selected)
+        self.group3.addButton(self.rad31, 0)
         hbox3.addWidget(self.rad31)
 
         self.rad32 = QRadioButton("KN")
-        self.rad32.setFont(QFont("Sanserif", 14))
-        self.rad32.toggled.connect(self.on_selected)
+        self.group3.addButton(self.rad32, 1)
         hbox3.addWidget(self.rad32)
 
         self.rad33 = QRadioButton("lb")
-        self.rad33.setFont(QFont("Sanserif", 14))
-        self.rad33.toggled.connect(self.on_selected)
+        self.group3.addButton(self.rad33, 2)
         hbox3.addWidget(self.rad33)
         self.groupbox3.setLayout(hbox3)
 
         self.rad34 = QRadioButton("kip")
-        self.rad34.setFont(QFont("Sanserif", 14))
-        self.rad34.toggled.connect(self.on_selected)
+        self.group3.addButton(self.rad34, 3)
         hbox3.addWidget(self.rad34)
         self.groupbox3.setLayout(hbox3)
 
         self.groupbox4 = QGroupBox("choose your output unit for Force")
-        self.groupbox4.setFont(QFont("Sanserif", 15))
         hbox4 = QHBoxLayout()
+        self.group4 = QButtonGroup(self)
+        self.group4.idClicked.connect(self.on_selected)
         self.rad41 = QRadioButton("N")
         self.rad41.setChecked(True)
-        self.rad41.setFont(QFont("Sanserif", 14))
-        self.rad41.toggled.connect(self.on_selected)
+        self.group4.addButton(self.rad41, 0)
         hbox4.addWidget(self.rad41)
 
         self.rad42 = QRadioButton("KN")
-        self.rad42.setFont(QFont("Sanserif", 14))
-        self.rad42.toggled.connect(self.on_selected)
+        self.group4.addButton(self.rad42, 1)
         hbox4.addWidget(self.rad42)
 
         self.rad43 = QRadioButton("lb")
-        self.rad43.setFont(QFont("Sanserif", 14))
-        self.rad43.toggled.connect(self.on_selected)
+        self.group4.addButton(self.rad43, 2)
         hbox4.addWidget(self.rad43)
         self.groupbox4.setLayout(hbox4)
 
         self.rad44 = QRadioButton("kip")
-        self.rad44.setFont(QFont("Sanserif", 14))
-        self.rad44.toggled.connect(self.on_selected)
+        self.group4.addButton(self.rad44, 3)
         hbox4.addWidget(self.rad44)
         self.groupbox4.setLayout(hbox4)
 
-    #method or slot for the toggled signal
-    def on_selected(self):
-        radio_button = self.sender()
-        if radio_button.isChecked():
-            self.label.setText("chosen Unit: " + radio_button.text())
-            s=str(radio_button.text())
-            units.append(s)
-            print(s)
+        #slot of units written by each group
+        self.slots = {self.group1: 0, self.group2: 1, self.group3: 2, self.group4: 3}
 
-    def undo(self):
-        print(units[-1] +" has been removed")
-        units.pop(-1)
+    #method or slot for the idClicked signal of the four groups
+    def on_selected(self, i):
+        radio_button = self.sender().button(i)
+        self.label.setText("chosen Unit: " + radio_button.text())
+        s=str(radio_button.text())
+        units[self.slots[self.sender()]] = s
+        clear_unit_caches()
+        print(s)
 
 class AnotherWindow7(QWidget):
     def __init__(self):
         super().__init__()
-        self.my_buttons()
+        self.sign = None
+        self._raw = {}          ## entered text, converted once the load is complete
         self.setMinimumSize(QSize(500, 500))
         self.setWindowTitle("Point Load")
 
-        self.nameLabel = QLabel(self)
-        self.nameLabel.setText('Position:')
-        self.line = QLineEdit(self)
-
-        self.line.move(160, 125)
-        self.line.resize(130, 20)
-        self.nameLabel.move(80, 120)
-
-        pybutton = QPushButton('OK', self)
-        pybutton.clicked.connect(self.clickMethod)
-        pybutton.resize(130, 20)
-        pybutton.move(160, 150)
-
-        self.nameLabel2 = QLabel(self)
-        self.nameLabel2.setText('Magnitude:')
-        self.line2 = QLineEdit(self)
-
-        self.line2.move(160, 175)
-        self.line2.resize(130, 20)
-        self.nameLabel2.move(80, 170)
-
-        pybutton2 = QPushButton('OK', self)
-        pybutton2.clicked.connect(self.clickMethod2)
-        pybutton2.resize(130, 20)
-        pybutton2.move(160, 200)
+        form = QFormLayout(self)
+        form.addRow(self.my_buttons())
+        self.line = add_input_row(form, 'Position:', self.clickMethod)
+        self.line2 = add_input_row(form, 'Magnitude:', self.clickMethod2)
 
     def clickMethod(self):
         print('pos: ' + self.line.text())
-        l=convert_len(float(self.line.text()),units[0],units[1])
-        listofinputs.append(l)
+        self._raw['pos'] = self.line.text()
 
     def clickMethod2(self):
         print('Mag: ' + self.line2.text())
-        l=convert_force(float(self.line2.text()),units[2],units[3])
-        listofinputs.append(l)
+        self._raw['mag'] = self.line2.text()
+        self.commit()
+
+    def commit(self):
+        if self.sign is None or len(self._raw) < 2:
+            print("please choose the direction and enter the position first")
+            return
+        pos, = convert_batch([self._raw['pos']], LEN_FACTOR[LEN_ID[units[0]], LEN_ID[units[1]]])
+        mag, = convert_batch([self._raw['mag']], FORCE_FACTOR[FORCE_ID[units[2]], FORCE_ID[units[3]]])
+        if room_for('pointloads'):
+            point_loads.append(PointLoad(self.sign, pos, mag))
+        self.sign = None
+        self._raw = {}
 
     def my_buttons(self):
-        btn1 = QPushButton(self)
-        btn1.setGeometry(160, 60, 60, 60)
-        btn1.setIcon(QIcon("up.jpg"))
+        btn1 = QPushButton()
+        btn1.setIcon(icon("up.jpg"))
         btn1.setIconSize(QSize(60, 60))
+        btn1.setFixedSize(QSize(60, 60))
         btn1.clicked.connect(self.button_clicked1)
 
-        btn2 = QPushButton(self)
-        btn2.setGeometry(290, 60, 60, 60)
-        btn2.setIcon(QIcon("down.jpg"))
+        btn2 = QPushButton()
+        btn2.setIcon(icon("down.jpg"))
         btn2.setIconSize(QSize(60, 60))
+        btn2.setFixedSize(QSize(60, 60))
         btn2.clicked.connect(self.button_clicked2)
 
+        hbox = QHBoxLayout()
+        hbox.addWidget(btn1)
+        hbox.addWidget(btn2)
+        return hbox
+
     def button_clicked1(self):
         print("pressed")
-        listofinputs.append("+")
+        self.sign = 1
 
     def button_clicked2(self):
         print("pressed")
-        listofinputs.append("-")
+        self.sign = -1
 
 class AnotherWindow11(QWidget):
     def __init__(self):
         super().__init__()
-        self.my_buttons()
+        self.dir = None
+        self._raw = {}          ## entered text, converted once the moment is complete
         self.setMinimumSize(QSize(500, 500))
         self.setWindowTitle("Moment")
 
-        self.nameLabel = QLabel(self)
-        self.nameLabel.setText('Position:')
-        self.line = QLineEdit(self)
-
-        self.line.move(160, 125)
-        self.line.resize(130, 20)
-        self.nameLabel.move(80, 125)
-
-        pybutton = QPushButton('OK', self)
-        pybutton.clicked.connect(self.clickMethod)
-        pybutton.resize(130,20)
-        pybutton.move(160, 150)
-
-        self.nameLabel3 = QLabel(self)
-        self.nameLabel3.setText(' Magnitude:')
-        self.line3 = QLineEdit(self)
-
-        self.line3.move(160, 175)
-        self.line3.resize(130, 20)
-        self.nameLabel3.move(80, 175)
-
-        pybutton3 = QPushButton('OK', self)
-        pybutton3.clicked.connect(self.clickMethod3)
-        pybutton3.resize(130,20)
-        pybutton3.move(160, 200)
+        form = QFormLayout(self)
+        form.addRow(self.my_buttons())
+        self.line = add_input_row(form, 'Position:', self.clickMethod)
+        self.line3 = add_input_row(form, 'Magnitude:', self.clickMethod3)
 
     def clickMethod(self):
-        l=convert_len(float(self.line.text()),units[0],units[1])
-        listofinputs.append(l)
+        self._raw['pos'] = self.line.text()
         print('Pos: ' + self.line.text())
 
     def clickMethod3(self):
-        l=convert_force(float(self.line3.text()), units[2], units[3])
-        listofinputs.append(l)
         print('Mag: ' + self.line3.text())
+        self._raw['mag'] = self.line3.text()
+        self.commit()
+
+    def commit(self):
+        if self.dir is None or len(self._raw) < 2:
+            print("please choose the direction and enter the position first")
+            return
+        pos, = convert_batch([self._raw['pos']], LEN_FACTOR[LEN_ID[units[0]], LEN_ID[units[1]]])
+        mag, = convert_batch([self._raw['mag']], FORCE_FACTOR[FORCE_ID[units[2]], FORCE_ID[units[3]]])
+        if room_for('moments'):
+            moments.append(Moment(self.dir, pos, mag))
+        self.dir = None
+        self._raw = {}
 
     def my_buttons(self):
-        btn1 = QPushButton(self)
-        btn1.setGeometry(160, 60, 60, 60)
-        btn1.setIcon(QIcon("counterclock.jpg"))
+        btn1 = QPushButton()
+        btn1.setIcon(icon("counterclock.jpg"))
         btn1.setIconSize(QSize(60, 60))
+        btn1.setFixedSize(QSize(60, 60))
         btn1.clicked.connect(self.button_clicked1)
 
-        btn2 = QPushButton(self)
-        btn2.setGeometry(290, 60, 60, 60)
-        btn2.setIcon(QIcon("clock.jpg"))
+        btn2 = QPushButton()
+        btn2.setIcon(icon("clock.jpg"))
         btn2.setIconSize(QSize(60, 60))
+        btn2.setFixedSize(QSize(60, 60))
         btn2.clicked.connect(self.button_clicked2)
 
+        hbox = QHBoxLayout()
+        hbox.addWidget(btn1)
+        hbox.addWidget(btn2)
+        return hbox
+
     def button_clicked1(self):
         print("pressed")
-        listofinputs.append("ccw")
+        self.dir = 1
 
     def button_clicked2(self):
         print("pressed")
-        listofinputs.append("cw")
+        self.dir = -1
 
 class AnotherWindow12(QWidget):
     def __init__(self):
         super().__init__()
         self.setMinimumSize(QSize(590, 602))
         self.setWindowTitle("Section properties")
-        self.namelabel1 = QLabel(self)
-        self.namelabel1.setText("TFw")
-        self.line = QLineEdit(self)
-        self.line.move(202, 250)
-        self.line.resize( 151, 31)
-        self.namelabel1.move(140, 260)
-        pybutton1 = QPushButton('OK', self)
-        pybutton1.clicked.connect(self.clickMethod)
-        pybutton1.resize(93, 28)
-        pybutton1.move(360, 250)
-
-        self.namelabel2 = QLabel(self)
-        self.namelabel2.setText("TFt")
-        self.line2 = QLineEdit(self)
-        self.line2.move(202, 290)
-        self.line2.resize( 151, 31)
-        self.namelabel2.move(140, 300)
-        pybutton2 = QPushButton('OK', self)
-        pybutton2.clicked.connect(self.clickMethod2)
-        pybutton2.resize(93, 28)
-        pybutton2.move(360, 290)
-        self.namelabel3 = QLabel(self)
-
-        self.namelabel3.setText("BFw")
-        self.line3 = QLineEdit(self)
-        self.line3.move(202, 330)
-        self.line3.resize(151, 31)
-        self.namelabel3.move(140, 340)
-        pybutton3 = QPushButton('OK', self)
-        pybutton3.clicked.connect(self.clickMethod3)
-        pybutton3.resize(93, 28)
-        pybutton3.move(360, 330)
-
-        self.namelabel4 = QLabel(self)
-        self.namelabel4.setText("BFt")
-        self.line4 = QLineEdit(self)
-        self.line4.move(202, 370)
-        self.line4.resize(151, 31)
-        self.namelabel4.move(140, 380)
-        pybutton4 = QPushButton('OK', self)
-        pybutton4.clicked.connect(self.clickMethod4)
-        pybutton4.resize(93, 28)
-        pybutton4.move(360, 370)
-
-        self.namelabel5 = QLabel(self)
-        self.namelabel5.setText("Wh")
-        self.line5 = QLineEdit(self)
-        self.line5.move(202, 410)
-        self.line5.resize(151, 31)
-        self.namelabel5.move(140, 420)
-        pybutton5 = QPushButton('OK', self)
-        pybutton5.clicked.connect(self.clickMethod5)
-        pybutton5.resize(93, 28)
-        pybutton5.move(360, 410)
-
-        self.namelabel6 = QLabel(self)
-        self.namelabel6.setText("Wt")
-        self.line6 = QLineEdit(self)
-        self.line6.move(202, 450)
-        self.line6.resize(151, 31)
-        self.namelabel6.move(140, 460)
-        pybutton6 = QPushButton('OK', self)
-        pybutton6.clicked.connect(self.clickMethod6)
-        pybutton6.resize(93, 28)
-        pybutton6.move(360, 450)
-
-        self.namelabel7 = QLabel(self)
-        self.namelabel7.setText("")
-        self.namelabel7.setPixmap(QtGui.QPixmap("IBeam.png"))
-        self.namelabel7.move(210, 30)
-
-        self.namelabel8 = QLabel(self)
-        self.namelabel8.setText("Modulus of Elasticity (GPa)")
-        self.line8 = QLineEdit(self)
-        self.line8.move(202, 490)
-        self.line8.resize(151, 31)
-        self.namelabel8.move(40 ,500)
-        pybutton8 = QPushButton('OK', self)
-        pybutton8.clicked.connect(self.clickMethod8)
-        pybutton8.resize(93, 28)
-        pybutton8.move(360, 490)
+        form = QFormLayout(self)
+        picture = QLabel()
+        picture.setPixmap(QtGui.QPixmap("IBeam.png"))
+        form.addRow(picture)
+        self.line = add_input_row(form, "TFw", self.clickMethod, 151)
+        self.line2 = add_input_row(form, "TFt", self.clickMethod2, 151)
+        self.line3 = add_input_row(form, "BFw", self.clickMethod3, 151)
+        self.line4 = add_input_row(form, "BFt", self.clickMethod4, 151)
+        self.line5 = add_input_row(form, "Wh", self.clickMethod5, 151)
+        self.line6 = add_input_row(form, "Wt", self.clickMethod6, 151)
+        self.line8 = add_input_row(form, "Modulus of Elasticity (GPa)", self.clickMethod8, 151)
 
     ##convert section geometry to output unit
     def clickMethod(self):
-        tfw=convert_len(float(self.line.text()),units[0],units[1])
         print(f"TFw={self.line.text()}")
-        listofinputs.append("I")
-        listofinputs.append(tfw)
+        self.store("TFw", self.line.text())
 
     def clickMethod2(self):
-        tft=convert_len(float(self.line2.text()),units[0],units[1])
         print(f"TFt={self.line2.text()}")
-        listofinputs.append(tft)
+        self.store("TFt", self.line2.text())
 
     def clickMethod3(self):
-        bfw=convert_len(float(self.line3.text()),units[0],units[1])
         print(f"BFw={self.line3.text()}")
-        listofinputs.append(bfw)
+        self.store("BFw", self.line3.text())
 
     def clickMethod4(self):
-        bft=convert_len(float(self.line4.text()),units[0],units[1])
         print(f"BFt={self.line4.text()}")
-        listofinputs.append(bft)
+        self.store("BFt", self.line4.text())
 
     def clickMethod5(self):
-        wh=convert_len(float(self.line5.text()),units[0],units[1])
         print(f"Wh={self.line5.text()}")
-        listofinputs.append(wh)
+        self.store("Wh", self.line5.text())
 
     def clickMethod6(self):
-        wt=convert_len(float(self.line6.text()),units[0],units[1])
         print(f"Wt={self.line6.text()}")
-        listofinputs.append(wt)
+        self.store("Wt", self.line6.text())
+
+    ## convert with the units selected when the dimension is entered
+    def store(self, name, text):
+        beam_inputs[name] = convert_len(float(text), units[0], units[1])
 
     def clickMethod8(self):
         E=float(self.line8.text())
         print(f"E={self.line8.text()}")
-        listofinputs.append("E")
-        listofinputs.append(E)
+        beam_inputs["E"] = E
 
 class AnotherWindow9(QWidget):
     def __init__(self):
         super().__init__()
-        self.my_buttons()
+        self.sign = None
+        self._raw = {}          ## entered text, converted once the load is complete
         self.setMinimumSize(QSize(500, 500))
         self.setWindowTitle("Distributed Load")
 
-        self.nameLabel = QLabel(self)
-        self.nameLabel.setText('Start Position:')
-        self.line = QLineEdit(self)
-
-        self.line.move(160, 125)
-        self.line.resize(130, 20)
-        self.nameLabel.move(80, 120)
-
-        pybutton = QPushButton('OK', self)
-        pybutton.clicked.connect(self.clickMethod)
-        pybutton.resize(130,20)
-        pybutton.move(160, 150)
-
-
-        self.nameLabel2 = QLabel(self)
-        self.nameLabel2.setText('End Position:')
-        self.line2 = QLineEdit(self)
-
-        self.line2.move(160, 175)
-        self.line2.resize(130, 20)
-        self.nameLabel2.move(80, 170)
-
-        pybutton2 = QPushButton('OK', self)
-        pybutton2.clicked.connect(self.clickMethod2)
-        pybutton2.resize(130,20)
-        pybutton2.move(160, 200)
-
-
-        self.nameLabel3 = QLabel(self)
-        self.nameLabel3.setText('Start Magnitude:')
-        self.line3 = QLineEdit(self)
-
-        self.line3.move(160, 225)
-        self.line3.resize(130, 20)
-        self.nameLabel3.move(80, 220)
-
-        pybutton3 = QPushButton('OK', self)
-        pybutton3.clicked.connect(self.clickMethod3)
-        pybutton3.resize(130,20)
-        pybutton3.move(160, 250)
-
-
-        self.nameLabel4 = QLabel(self)
-        self.nameLabel4.setText('End Magnitude:')
-        self.line4 = QLineEdit(self)
-
-        self.line4.move(160, 275)
-        self.line4.resize(130, 20)
-        self.nameLabel4.move(80, 270)
-
-        pybutton4 = QPushButton('OK', self)
-        pybutton4.clicked.connect(self.clickMethod4)
-        pybutton4.resize(130,20)
-        pybutton4.move(160, 300)
+        form = QFormLayout(self)
+        form.addRow(self.my_buttons())
+        self.line = add_input_row(form, 'Start Position:', self.clickMethod)
+        self.line2 = add_input_row(form, 'End Position:', self.clickMethod2)
+        self.line3 = add_input_row(form, 'Start Magnitude:', self.clickMethod3)
+        self.line4 = add_input_row(form, 'End Magnitude:', self.clickMethod4)
 
     def clickMethod(self):
-        l=convert_len(float(self.line.text()),units[0],units[1])
-        listofinputs.append(l)
+        self._raw['start'] = self.line.text()
         print('start pos: ' + self.line.text())
 
     def clickMethod2(self):
-        l = convert_len(float(self.line2.text()), units[0], units[1])
-        listofinputs.append(l)
+        self._raw['end'] = self.line2.text()
         print('End pos: ' + self.line2.text())
 
     def clickMethod3(self):
-        l = convert_force(float(self.line3.text()), units[2], units[3])
-        listofinputs.append(l)
+        self._raw['start_mag'] = self.line3.text()
         print('Start Mag: ' + self.line3.text())
 
     def clickMethod4(self):
-        l = convert_force(float(self.line4.text()), units[2], units[3])
-        listofinputs.append(l)
+        self._raw['end_mag'] = self.line4.text()
         print('End Mag: ' + self.line4.text())
+        self.commit()
+
+    def commit(self):
+        if self.sign is None or len(self._raw) < 4:
+            print("please choose the direction and enter the positions and start magnitude first")
+            return
+        start, end = convert_batch([self._raw['start'], self._raw['end']], LEN_FACTOR[LEN_ID[units[0]], LEN_ID[units[1]]])
+        start_mag, end_mag = convert_batch([self._raw['start_mag'], self._raw['end_mag']],
+                                           FORCE_FACTOR[FORCE_ID[units[2]], FORCE_ID[units[3]]])
+        if room_for('distloads'):
+            dist_loads.append(DistLoad(self.sign, start, end, start_mag, end_mag))
+        self.sign = None
+        self._raw = {}
 
     def my_buttons(self):
-        btn1 = QPushButton(self)
-        btn1.setGeometry(160, 60, 60, 60)
-        btn1.setIcon(QIcon("up.jpg"))
+        btn1 = QPushButton()
+        btn1.setIcon(icon("up.jpg"))
         btn1.setIconSize(QSize(60, 60))
+        btn1.setFixedSize(QSize(60, 60))
         btn1.clicked.connect(self.button_clicked1)
 
-        btn2 = QPushButton(self)
-        btn2.setGeometry(290, 60, 60, 60)
-        btn2.setIcon(QIcon("down.jpg"))
+        btn2 = QPushButton()
+        btn2.setIcon(icon("down.jpg"))
         btn2.setIconSize(QSize(60, 60))
+        btn2.setFixedSize(QSize(60, 60))
         btn2.clicked.connect(self.button_clicked2)
 
+        hbox = QHBoxLayout()
+        hbox.addWidget(btn1)
+        hbox.addWidget(btn2)
+        return hbox
+
     def button_clicked1(self):
-        listofinputs.append("+")
+        self.sign = 1
         print("pressed")
 
     def button_clicked2(self):
-        listofinputs.append("-")
+        self.sign = -1
         print("pressed")
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.Window = Main_Window()
-        self.Window1 = AnotherWindow1()
-        self.Window2 = AnotherWindow2()
-        self.Window3 = AnotherWindow3()
-        self.Window4 = AnotherWindow4()
-        self.Window5 = AnotherWindow5()
-        self.Window6 = AnotherWindow6()
-        self.Window7 = AnotherWindow7()
-        self.Window8 = AnotherWindow8()
-        self.Window9 = AnotherWindow9()
-        self.Window10 = AnotherWindow10()
-        self.Window11 = AnotherWindow11()
-        self.Window12 = AnotherWindow12()
+        ## windows are only built the first time their button is pressed
+        self._factories = {
+            0: Main_Window,
+            1: lambda: NumericPrompt('please enter the length of the beam:', 'Add beam', 'length',
+                                     converter=lambda text: convert_len(float(text), units[0], units[1])),
+            2: lambda: NumericPrompt('please enter the number of supports:', 'number of supports', 'supports'),
+            3: AnotherWindow3,
+            4: AnotherWindow4,
+            5: AnotherWindow5,
+            6: lambda: NumericPrompt('please enter the number of Point Loads:', 'number of point loads', 'pointloads'),
+            7: AnotherWindow7,
+            8: lambda: NumericPrompt('please enter the number of Distributed Loads:', 'number of distributed loads', 'distloads'),
+            9: AnotherWindow9,
+            10: lambda: NumericPrompt('please enter the number of Moments:', 'number of Moments', 'moments'),
+            11: AnotherWindow11,
+            12: AnotherWindow12,
+        }
+        self._windows = {}
         l = QVBoxLayout()
-        button = QPushButton("Title")
-        button.clicked.connect(self.toggle_Window)
-        l.addWidget(button)
-
-        button1 = QPushButton("Choose your preferred units")
-        button1.clicked.connect(self.toggle_Window5)
-        l.addWidget(button1)
-
-        button2 = QPushButton("Add Beam")
-        button2.clicked.connect(self.toggle_Window1)
-        l.addWidget(button2)
-
-        button3 = QPushButton("Enter the number of supports")
-        button3.clicked.connect(self.toggle_Window2)
-        l.addWidget(button3)
-
-        button4 = QPushButton("Choose the support types")
-        button4.clicked.connect(self.toggle_Window3)
-        l.addWidget(button4)
-
-        button5 = QPushButton("Place of supports")
-        button5.clicked.connect(self.toggle_Window4)
-        l.addWidget(button5)
-
-        button6 = QPushButton("Number of Point Loads")
-        button6.clicked.connect(self.toggle_Window6)
-        l.addWidget(button6)
-
-        button7 = QPushButton("Add Point Load")
-        button7.clicked.connect(self.toggle_Window7)
-        l.addWidget(button7)
-
-        button8 = QPushButton("Number of Distributed Loads")
-        button8.clicked.connect(self.toggle_Window8)
-        l.addWidget(button8)
-
-
-        button9 = QPushButton("Add Distributed Load")
-        button9.clicked.connect(self.toggle_Window9)
-        l.addWidget(button9)
-
-        button10 = QPushButton("Number of Moments")
-        button10.clicked.connect(self.toggle_Window10)
-        l.addWidget(button10)
-
-        button11 = QPushButton("Add Moment")
-        button11.clicked.connect(self.toggle_Window11)
-        l.addWidget(button11)
-
-        button12 = QPushButton("Section Properties")
-        button12.clicked.connect(self.toggle_Window12)
-        l.addWidget(button12)
+        ## (button text, window number) in the order the buttons are shown
+        for text, n in (("Title", 0),
+                        ("Choose your preferred units", 5),
+                        ("Add Beam", 1),
+                        ("Enter the number of supports", 2),
+                        ("Choose the support types", 3),
+                        ("Place of supports", 4),
+                        ("Number of Point Loads", 6),
+                        ("Add Point Load", 7),
+                        ("Number of Distributed Loads", 8),
+                        ("Add Distributed Load", 9),
+                        ("Number of Moments", 10),
+                        ("Add Moment", 11),
+                        ("Section Properties", 12)):
+            button = QPushButton(text)
+            button.clicked.connect(lambda checked, n=n: self._toggle(n))
+            l.addWidget(button)
 
         w = QWidget()
         w.setLayout(l)
         self.setCentralWidget(w)
 
-    def toggle_Window(self, checked):
-        if self.Window.isVisible():
-            self.Window.hide()
-
-        else:
-            self.Window.show()
-    def toggle_Window1(self, checked):
-        if self.Window1.isVisible():
-            self.Window1.hide()
-
-        else:
-            self.Window1.show()
-
-    def toggle_Window2(self, checked):
-        if self.Window2.isVisible():
-            self.Window2.hide()
-
-        else:
-            self.Window2.show()
-
-    def toggle_Window3(self, checked):
-        if self.Window3.isVisible():
-            self.Window3.hide()
-
-        else:
-            self.Window3.show()
-    def toggle_Window4(self, checked):
-        if self.Window4.isVisible():
-            self.Window4.hide()
-
-        else:
-            self.Window4.show()
-
-    def toggle_Window5(self, checked):
-        if self.Window5.isVisible():
-            self.Window5.hide()
-
-        else:
-            self.Window5.show()
-
-    def toggle_Window6(self, checked):
-        if self.Window6.isVisible():
-            self.Window6.hide()
-
-        else:
-            self.Window6.show()
+    def _window(self, n):
+        if n not in self._windows:
+            self._windows[n] = self._factories[n]()
+        return self._windows[n]
 
-    def toggle_Window7(self, checked):
-        if self.Window7.isVisible():
-            self.Window7.hide()
+    def _toggle(self, n):
+        window = self._window(n)
+        if window.isVisible():
+            window.hide()
 
         else:
-            self.Window7.show()
-    def toggle_Window8(self, checked):
-        if self.Window8.isVisible():
-            self.Window8.hide()
-
-        else:
-            self.Window8.show()
-
-    def toggle_Window9(self, checked):
-        if self.Window9.isVisible():
-            self.Window9.hide()
-
-        else:
-            self.Window9.show()
-
-    def toggle_Window10(self, checked):
-        if self.Window10.isVisible():
-            self.Window10.hide()
-
-        else:
-            self.Window10.show()
-
-    def toggle_Window11(self, checked):
-        if self.Window11.isVisible():
-            self.Window11.hide()
-
-        else:
-            self.Window11.show()
-
-    def toggle_Window12(self, checked):
-        if self.Window12.isVisible():
-            self.Window12.hide()
-
-        else:
-            self.Window12.show()
+            window.show()
 
 app = QApplication(sys.argv)
+app.setFont(APP_FONT)
+app.setStyleSheet(APP_STYLE)
+## compile MomentOfInertia while the user fills in the inputs
+threading.Thread(target=MomentOfInertia, args=(1.0,)*6, daemon=True).start()
 w = MainWindow()
 w.show()
 app.exec()
+check_counts()
+
+print(beam_inputs, supports, point_loads, dist_loads, moments, sep="\n")
+length=beam_inputs["length"]
+print(f"length: {length:.4f}{units[1]}")
 
-print(listofinputs)
-length=listofinputs[0]
-
-## Reaction forces or moment (unknown)
-R1, R2 = symbols('R1, R2')
-for _ in listofinputs:
-    if _=="I":
-        m = listofinputs.index("I")
-        I=MomentOfInertia(listofinputs[m+3],listofinputs[m+4],listofinputs[m+5],listofinputs[m+6],listofinputs[m+1],listofinputs[m+2])
-    if _=="E":
-        m=listofinputs.index("E")
-        E=listofinputs[m+1]
-## elastic modals and second moment are not needed
-## b for drawing the beam
-b = Beam(length, E*10**9, I)
-
-## diagram for bmd and sfd plots
-diagram = Beam(length, E*10**9, I)
-diagram2 = Beam(length, E*10**9, I)
-## make inputs productive
-for _ in listofinputs:
-    if _=="pointload":
-        ## find the point load string in list
-        p = listofinputs.index("pointload")
-        if listofinputs[p + 2] == "+":
-            b.apply_load(-listofinputs[p + 4], listofinputs[p + 3], -1)
-            diagram.apply_load(-listofinputs[p + 4], listofinputs[p + 3], -1)
-            diagram2.apply_load(listofinputs[p + 4], listofinputs[p + 3], -1)
-        elif listofinputs[p + 2] == "-":
-            b.apply_load(+listofinputs[p + 4], listofinputs[p + 3], -1)
-            diagram.apply_load(+listofinputs[p + 4], listofinputs[p + 3], -1)
-            diagram2.apply_load(-listofinputs[p + 4], listofinputs[p + 3], -1)
-        if listofinputs[p + 1] == 2:
-            if listofinputs[p + 5] == "+":
-                b.apply_load(-listofinputs[p + 7], listofinputs[p + 6], -1)
-                diagram.apply_load(-listofinputs[p + 7], listofinputs[p + 6], -1)
-                diagram2.apply_load(+listofinputs[p + 7], listofinputs[p + 6], -1)
-            if listofinputs[p + 5] == "-":
-                b.apply_load(listofinputs[p + 7], listofinputs[p + 6], -1)
-                diagram.apply_load(-listofinputs[p + 7], listofinputs[p + 6], -1)
-                diagram2.apply_load(-listofinputs[p + 7], listofinputs[p + 6], -1)
-    if _=="distload":
-        ## find the distributed load string in list
-        d=listofinputs.index("distload")
-        if listofinputs[d + 2] == "+":
-            if listofinputs[d+5]==listofinputs[d+6]:
-                b.apply_load(-listofinputs[d+5],listofinputs[d+3],0,listofinputs[d+4])
-                diagram.apply_load(-listofinputs[d + 5], listofinputs[d + 3], 0, listofinputs[d + 4])
-                diagram2.apply_load(listofinputs[d + 5], listofinputs[d + 3], 0, listofinputs[d + 4])
-            else:
-                if listofinputs[d+5]==0:
-                    b.apply_load(-listofinputs[d+6],listofinputs[d+3],1,listofinputs[d+4])
-                    diagram.apply_load(-listofinputs[d + 6], listofinputs[d + 3], 1, listofinputs[d + 4])
-                    diagram2.apply_load(listofinputs[d + 6], listofinputs[d + 3], 1, listofinputs[d + 4])
-                if listofinputs[d+6]==0:
-                    b.apply_load(-listofinputs[d + 5], listofinputs[d + 4], 1, listofinputs[d + 3])
-                    diagram.apply_load(listofinputs[d + 5], listofinputs[d + 4], 1, listofinputs[d + 3])
-        if listofinputs[d+2]=="-":
-            if listofinputs[d+5]==listofinputs[d+6]:
-                b.apply_load(listofinputs[d+5],listofinputs[d+3],0,listofinputs[d+4])
-                diagram.apply_load(listofinputs[d + 5], listofinputs[d + 3], 0, listofinputs[d + 4])
-                diagram2.apply_load(-listofinputs[d + 5], listofinputs[d + 3], 0, listofinputs[d + 4])
-            else:
-                if listofinputs[d+5]==0:
-                    b.apply_load(listofinputs[d+6],listofinputs[d+3],1,listofinputs[d+4])
-                    diagram.apply_load(listofinputs[d + 6], listofinputs[d + 3], 1, listofinputs[d + 4])
-                    diagram2.apply_load(-listofinputs[d + 6], listofinputs[d + 3], 1, listofinputs[d + 4])
-                if listofinputs[d+6]==0:
-                    b.apply_load(listofinputs[d + 5], listofinputs[d + 4], 1, listofinputs[d + 3])
-                    diagram.apply_load(listofinputs[d + 5], listofinputs[d + 4], 1, listofinputs[d + 3])
-                    diagram2.apply_load(-listofinputs[d + 5], listofinputs[d + 4], 1, listofinputs[d + 3])
-        if listofinputs[d+1]==2:
-            if listofinputs[d + 7] == "+":
-                if listofinputs[d+10]==listofinputs[d+11]:
-                    b.apply_load(-listofinputs[d+10],listofinputs[d+8],0,listofinputs[d+9])
-                    diagram.apply_load(-listofinputs[d + 10], listofinputs[d + 8], 0, listofinputs[d + 9])
-                    diagram2.apply_load(listofinputs[d + 10], listofinputs[d + 8], 0, listofinputs[d + 9])
-
-                else:
-                    if listofinputs[d+10]==0:
-                        b.apply_load(-listofinputs[d+11],listofinputs[d+10],1,listofinputs[d+9])
-                        diagram.apply_load(-listofinputs[d + 11], listofinputs[d + 10], 1, listofinputs[d + 9])
-                        diagram2.apply_load(listofinputs[d + 11], listofinputs[d + 10], 1, listofinputs[d + 9])
-                    if listofinputs[d+11]==0:
-                        b.apply_load(-listofinputs[d + 10], listofinputs[d + 9], 1, listofinputs[d + 8])
-                        diagram.apply_load(-listofinputs[d + 10], listofinputs[d + 9], 1, listofinputs[d + 8])
-                        diagram2.apply_load(listofinputs[d + 10], listofinputs[d + 9], 1, listofinputs[d + 8])
-            if listofinputs[d+7]=="-":
-                if listofinputs[d+10]==listofinputs[d+11]:
-                    b.apply_load(listofinputs[d+10],listofinputs[d+8],0,listofinputs[d+9])
-                    diagram.apply_load(listofinputs[d + 10], listofinputs[d + 8], 0, listofinputs[d + 9])
-                    diagram2.apply_load(listofinputs[d + 10], listofinputs[d + 8], 0, listofinputs[d + 9])
-                else:
-                    if listofinputs[d+10]==0:
-                        b.apply_load(listofinputs[d+11],listofinputs[d+8],1,listofinputs[d+9])
-                        diagram.apply_load(listofinputs[d + 11], listofinputs[d + 8], 1, listofinputs[d + 9])
-                        diagram2.apply_load(listofinputs[d + 11], listofinputs[d + 8], 1, listofinputs[d + 9])
-                    if listofinputs[d+11]==0:
-                        b.apply_load(listofinputs[d + 10], listofinputs[d + 9], 1, listofinputs[d + 8])
-                        diagram.apply_load(listofinputs[d + 10], listofinputs[d + 9], 1, listofinputs[d + 8])
-                        diagram2.apply_load(listofinputs[d + 10], listofinputs[d + 9], 1, listofinputs[d + 8])
-
-    if _=="moment":
-        ## find the moment string in list
-        m=listofinputs.index("moment")
-        ## - sign for clockwise and + for counter clockwise moment
-        if listofinputs[m + 2] == "ccw":
-            b.apply_load(listofinputs[m + 4], listofinputs[m + 3], -2)
-            diagram.apply_load(listofinputs[m + 4], listofinputs[m + 3], -2)
-            diagram2.apply_load(-listofinputs[m + 4], listofinputs[m + 3], -2)
-        if listofinputs[m + 2] == "cw":
-            b.apply_load(-listofinputs[m + 4], listofinputs[m + 3], -2)
-            diagram.apply_load(-listofinputs[m + 4], listofinputs[m + 3], -2)
-            diagram2.apply_load(listofinputs[m + 4], listofinputs[m + 3], -2)
-        if listofinputs[m + 1] == 2:
-            if listofinputs[m + 5] == "ccw":
-                b.apply_load(listofinputs[m + 7], listofinputs[m + 6], -2)
-                diagram.apply_load(listofinputs[m + 7], listofinputs[m + 6], -2)
-                diagram2.apply_load(-listofinputs[m + 7], listofinputs[m + 6], -2)
-            if listofinputs[m + 5] == "cw":
-                b.apply_load(-listofinputs[m + 7], listofinputs[m + 6], -2)
-                diagram.apply_load(-listofinputs[m + 7], listofinputs[m + 6], -2)
-                diagram2.apply_load(listofinputs[m + 7], listofinputs[m + 6], -2)
-
-## if 2 supports are added to the beam
-if listofinputs[1] == 2:
-    sup_1 = listofinputs[2]
-    sup_1_place = listofinputs[4]
-    sup_2 = listofinputs[3]
-    sup_2_place = listofinputs[5]
-    b.apply_support(sup_1_place, sup_1)
-    b.apply_support(sup_2_place, sup_2)
-    b.apply_load(R1, sup_1_place, -1)
-    b.apply_load(R2, sup_2_place, -1)
-    diagram.apply_load(R1, sup_1_place, -1)
-    diagram.apply_load(R2, sup_2_place, -1)
-    diagram2.apply_load(R1, sup_1_place, -1)
-    diagram2.apply_load(R2, sup_2_place, -1)
-    diagram2.bc_deflection=[(sup_1_place,0),(sup_2_place,0)]
-
-
-## if 1 support is added to the beam
-if listofinputs[1]==1:
-    sup_1 = listofinputs[2]
-    sup_1_place=listofinputs[3]
-    b.apply_support(sup_1_place,sup_1)
-    b.apply_load(R1,sup_1_place,-2)
-    b.apply_load(R2, sup_1_place, -1)
-    diagram.apply_load(R1,sup_1_place,-2)
-    diagram.apply_load(R2, sup_1_place, -1)
-    diagram2.apply_load(R1,sup_1_place,-2)
-    diagram2.apply_load(R2, sup_1_place, -1)
-    diagram2.bc_deflection=[(sup_1_place,0)]
-    diagram2.bc_slope=[(sup_1_place,0)]
+I=MomentOfInertia(beam_inputs["BFw"],beam_inputs["BFt"],beam_inputs["Wh"],beam_inputs["Wt"],beam_inputs["TFw"],beam_inputs["TFt"])
+E=beam_inputs["E"]
+b, diagram, diagram2, deflection, slope = solve_beam(length, E, I, as_key(supports), as_key(point_loads),
+                                                     as_key(dist_loads), as_key(moments))
 
 #Plot
-p=b.draw()
-p.show()
-diagram.solve_for_reaction_loads(R1, R2)
-diagram2.solve_for_reaction_loads(R1, R2)
-diagram.plot_bending_moment()
-diagram.plot_shear_force()
-print(f"\nDeflection formula: {diagram2.deflection()}")
-diagram2.plot_deflection()
-print(f"Slope formula: {diagram2.slope()}")
-diagram2.plot_slope()
+## BEAM_GUI=0 skips drawing the beam, e.g. on a machine without a display
+if os.environ.get('BEAM_GUI', '1') == '1':
+    p=b.draw()
+    p.show()
+print(f"\nDeflection formula: {deflection}")
+print(f"Slope formula: {slope}")
+xs, (bm, sf, defl, slp) = sample_curves([diagram.bending_moment(), diagram.shear_force(), deflection, slope], length)
+plot_curves([
+    (xs, bm, 'Bending Moment', r'$\mathrm{M}$', 'b'),
+    (xs, sf, 'Shear Force', r'$\mathrm{V}$', 'g'),
+    (xs, defl, 'Deflection', r'$\delta$', 'r'),
+    (xs, slp, 'Slope', r'$\theta$', 'm'),
+])
 
 #Taking input from the user and calculating deflection and slope at specified point
 
-def SingularityFunction(x, a, n):
-    if x < a:
-        return 0
-    else:
-        return (x - a) ** n
+## built once, also accepts a numpy array of positions
+defl_fn = singularity_fn(deflection)
+slope_fn = singularity_fn(slope)
 
 x=float(input(f"Please input x in {units[1]}: "))
-f = lambda x: eval(str(diagram2.deflection()))
-g = lambda x: eval(str(diagram2.slope()))
-print(f"Deflection @x={x}{units[1]}:{f(x)}")
-print(f"Slope @x={x}{units[1]}:{g(x)}")
\ No newline at end of file
+print(f"Deflection @x={x}{units[1]}:{float(defl_fn(x))}")
+print(f"Slope @x={x}{units[1]}:{float(slope_fn(x))}")
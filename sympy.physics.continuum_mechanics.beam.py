@@ -3,21 +3,29 @@ This module can be used to solve 2D beam bending problems with
 singularity functions in mechanics.
 """
 
+from collections import Counter
+from functools import lru_cache
+
 from sympy.core import S, Symbol, diff, symbols
 from sympy.core.add import Add
 from sympy.core.expr import Expr
 from sympy.core.function import (Derivative, Function)
-from sympy.core.mul import Mul
 from sympy.core.relational import Eq
+from sympy.core.sorting import default_sort_key
 from sympy.core.sympify import sympify
+from sympy.polys.polyerrors import PolynomialError
+from sympy.polys.polytools import Poly, degree
 from sympy.solvers import linsolve
+from sympy.solvers.solveset import linear_eq_to_matrix
 from sympy.solvers.ode.ode import dsolve
 from sympy.solvers.solvers import solve
 from sympy.printing import sstr
-from sympy.functions import SingularityFunction, Piecewise, factorial
+from sympy.functions import SingularityFunction, Piecewise, binomial, factorial, piecewise_fold
 from sympy.integrals import integrate
 from sympy.series import limit
 from sympy.plotting import plot, PlotGrid
+from sympy.plotting.plot import plot_factory
+from sympy.plotting.series import List2DSeries
 from sympy.geometry.entity import GeometryEntity
 from sympy.external import import_module
 from sympy.sets.sets import Interval
@@ -28,6 +36,118 @@ from sympy.utilities.iterables import iterable
 numpy = import_module('numpy', import_kwargs={'fromlist':['arange']})
 
 
+def _fast_sympify(v):
+    """
+    sympify for load and support arguments. SymPy expressions are passed
+    through as they are; plain Python numbers still go through sympify so
+    that stored loads and reaction symbol names are unchanged.
+    """
+    if isinstance(v, Expr):
+        return v
+    return sympify(v)
+
+
+@lru_cache(maxsize=128)
+def _cached_lambdify(expr, var, modules='numpy'):
+    """
+    lambdify keyed on the expression. Every lambdify call compiles new
+    source and keeps it in linecache, so beams that are evaluated again
+    with the same curves reuse the function made the first time.
+    """
+    return lambdify(var, expr, modules)
+
+
+@lru_cache(maxsize=128)
+def _as_piecewise(expr):
+    """
+    Folded Piecewise form of a SingularityFunction expression, which
+    NumPy can evaluate directly. Plotting the same curve again, with the
+    same or other substitutions, reuses the rewrite.
+    """
+    return piecewise_fold(expr.rewrite(Piecewise))
+
+
+@lru_cache(maxsize=128)
+def _free_symbols(expr):
+    """
+    Symbols of a beam curve, checked against the substitutions given to
+    the plotting methods. Replotting a curve does not walk it again.
+    """
+    return frozenset(expr.free_symbols)
+
+
+def _missing_symbol(exprs, x, subs):
+    """
+    First symbol of ``exprs``, other than ``x``, without a value in
+    ``subs``, looked up in the order the plotting methods have always
+    reported it.
+    """
+    for expr in exprs:
+        for sym in expr.atoms(Symbol):
+            if sym != x and sym not in subs:
+                return sym
+
+
+@lru_cache(maxsize=32)
+def _numeric_entry(exprs, var):
+    """
+    Sampling state of the curves ``exprs``: the NumPy lambdified function
+    shared by all of them, with common subexpressions eliminated, and how
+    often they have been sampled.
+    """
+    return {'calls': 0, 'function': lambdify(var, exprs, 'numpy', cse=True)}
+
+
+def _numeric(exprs, var):
+    """
+    Vectorised function of ``var`` returning one array per expression in
+    the tuple ``exprs``. Curves sampled a second time, which is when the
+    compilation pays off, are compiled to ufuncs if numba is installed;
+    otherwise, or if numba cannot compile them, the NumPy function is kept.
+    """
+    entry = _numeric_entry(exprs, var)
+    entry['calls'] += 1
+    if entry['calls'] == 2:
+        numba = import_module('numba')
+        if numba is not None:
+            modules = [lambdify(var, expr, 'math') for expr in exprs]
+            try:
+                ufuncs = [numba.vectorize(['float64(float64)'])(f) for f in modules]
+            except numba.core.errors.NumbaError:
+                pass
+            else:
+                entry['function'] = lambda values: [ufunc(values) for ufunc in ufuncs]
+    return entry['function']
+
+
+def _solve_linear(equations, unknowns):
+    """
+    First solution of the linear ``equations`` for ``unknowns``. Square
+    systems with a single solution, which is what the boundary conditions
+    of a determinate beam give, are solved directly by LU decomposition;
+    anything else goes through linsolve.
+    """
+    A, b = linear_eq_to_matrix(equations, unknowns)
+    if A.is_square:
+        try:
+            return tuple(A.LUsolve(b))
+        except ValueError:
+            pass
+    return list(linsolve(equations, unknowns).args)[0]
+
+
+@lru_cache(maxsize=128)
+def _joined_second_moment(x, length, new_length, second_moment_1, second_moment_2):
+    """
+    Second moment of two joined beams. Equal sections keep the plain
+    expression and only different ones get a Piecewise, which is built
+    once per combination of sections and lengths.
+    """
+    if second_moment_1 is second_moment_2 or second_moment_1 == second_moment_2:
+        return second_moment_1
+    return Piecewise((second_moment_1, x<=length),
+                    (second_moment_2, x<=new_length))
+
 
 class Beam:
     def __init__(self, length, elastic_modulus, second_moment, area=Symbol('A'), variable=Symbol('x'), base_char='C'):
@@ -79,18 +199,28 @@ class Beam:
         self.variable = variable
         self._base_char = base_char
         self._boundary_conditions = {'deflection': [], 'slope': []}
-        self._load = 0
+        # The load is kept as a list of terms and only summed when it is
+        # read, so applying N loads does not rebuild the Add N times.
+        self._load_terms = []
         self._area = area
         self._applied_supports = []
         self._support_as_loads = []
         self._applied_loads = []
+        # How many times each load is on the beam, and how many removed
+        # loads are still to be dropped from _applied_loads.
+        self._applied_loads_count = Counter()
+        self._removed_loads = Counter()
         self._reaction_loads = {}
         self._ild_reactions = {}
         self._ild_shear = 0
         self._ild_moment = 0
-        # _original_load is a copy of _load equations with unsubstituted reaction
+        # _original_load is the sum of _load_terms with unsubstituted reaction
         # forces. It is used for calculating reaction forces in case of I.L.D.
-        self._original_load = 0
+        # _load is derived from it by substituting _reaction_loads.
+        # summed load, shear force, bending moment, their Piecewise forms and
+        # the slope and deflection for the current _load, cleared whenever
+        # _load changes.
+        self._load_cache = {}
         self._composite_type = None
         self._hinge_position = None
 
@@ -152,6 +282,7 @@ class Beam:
     def variable(self, v):
         if isinstance(v, Symbol):
             self._variable = v
+            self._load_cache = {}
         else:
             raise TypeError("""The variable should be a Symbol object.""")
 
@@ -235,11 +366,8 @@ class Beam:
         x = self.variable
         E = self.elastic_modulus
         new_length = self.length + beam.length
-        if self.second_moment != beam.second_moment:
-            new_second_moment = Piecewise((self.second_moment, x<=self.length),
-                                    (beam.second_moment, x<=new_length))
-        else:
-            new_second_moment = self.second_moment
+        new_second_moment = _joined_second_moment(x, self.length, new_length,
+                                    self.second_moment, beam.second_moment)
 
         if via == "fixed":
             new_beam = Beam(new_length, E, new_second_moment, x)
@@ -267,7 +395,7 @@ class Beam:
             - one degree of freedom, type = "pin"
             - two degrees of freedom, type = "roller"
         """
-        loc = sympify(loc)
+        loc = _fast_sympify(loc)
         self._applied_supports.append((loc, type))
         if type in ("pin", "roller"):
             reaction_load = Symbol('R_'+str(loc))
@@ -320,13 +448,14 @@ class Beam:
             within the length of the beam.
         """
         x = self.variable
-        value = sympify(value)
-        start = sympify(start)
-        order = sympify(order)
+        value = _fast_sympify(value)
+        start = _fast_sympify(start)
+        order = _fast_sympify(order)
 
         self._applied_loads.append((value, start, order, end))
-        self._load += value*SingularityFunction(x, start, order)
-        self._original_load += value*SingularityFunction(x, start, order)
+        self._applied_loads_count[(value, start, order, end)] += 1
+        self._load_terms.append(value*SingularityFunction(x, start, order))
+        self._load_cache.clear()
 
         if end:
             # load has an end point within the length of the beam.
@@ -358,14 +487,16 @@ class Beam:
             within the length of the beam.
         """
         x = self.variable
-        value = sympify(value)
-        start = sympify(start)
-        order = sympify(order)
-
-        if (value, start, order, end) in self._applied_loads:
-            self._load -= value*SingularityFunction(x, start, order)
-            self._original_load -= value*SingularityFunction(x, start, order)
-            self._applied_loads.remove((value, start, order, end))
+        value = _fast_sympify(value)
+        start = _fast_sympify(start)
+        order = _fast_sympify(order)
+
+        load = (value, start, order, end)
+        if self._applied_loads_count[load]:
+            self._load_terms.append(-value*SingularityFunction(x, start, order))
+            self._applied_loads_count[load] -= 1
+            self._removed_loads[load] += 1
+            self._load_cache.clear()
         else:
             msg = "No such load distribution exists on the beam object."
             raise ValueError(msg)
@@ -387,24 +518,47 @@ class Beam:
             raise ValueError(msg)
         # NOTE : A Taylor series can be used to define the summation of
         # singularity functions that subtract from the load past the end
-        # point such that it evaluates to zero past 'end'.
-        f = value*x**order
-
+        # point such that it evaluates to zero past 'end'. For value*x**order
+        # the i-th Taylor coefficient about end - start is
+        # value*binomial(order, i)*(end - start)**(order - i).
         if type == "apply":
-            # iterating for "apply_load" method
-            for i in range(0, order + 1):
-                self._load -= (f.diff(x, i).subs(x, end - start) *
-                                SingularityFunction(x, end, i)/factorial(i))
-                self._original_load -= (f.diff(x, i).subs(x, end - start) *
-                                SingularityFunction(x, end, i)/factorial(i))
+            # "apply_load" subtracts the terms past the end point
+            coeff = -value
         elif type == "remove":
-            # iterating for "remove_load" method
-            for i in range(0, order + 1):
-                self._load += (f.diff(x, i).subs(x, end - start) *
-                                SingularityFunction(x, end, i)/factorial(i))
-                self._original_load += (f.diff(x, i).subs(x, end - start) *
-                                SingularityFunction(x, end, i)/factorial(i))
+            # "remove_load" adds them back
+            coeff = value
+        else:
+            return
+        span = end - start
+        for i in range(order, -1, -1):
+            self._load_terms.append(coeff*binomial(order, i)*SingularityFunction(x, end, i))
+            coeff *= span
+        self._load_cache.clear()
+
 
+    @property
+    def _original_load(self):
+        if 'original_load' not in self._load_cache:
+            self._load_cache['original_load'] = Add(*self._load_terms)
+        return self._load_cache['original_load']
+
+    @_original_load.setter
+    def _original_load(self, value):
+        self._load_terms = list(Add.make_args(sympify(value)))
+        self._load_cache.clear()
+
+    @property
+    def _load(self):
+        if 'load' not in self._load_cache:
+            self._load_cache['load'] = self._original_load.xreplace(self._reaction_loads)
+        return self._load_cache['load']
+
+    @_load.setter
+    def _load(self, value):
+        # A load assigned directly stands in for the one with the reactions
+        # substituted until the loads or reactions change again.
+        self._load_cache.clear()
+        self._load_cache['load'] = sympify(value)
 
     @property
     def load(self):
@@ -420,6 +574,17 @@ class Beam:
         Returns a list of all loads applied on the beam object.
         Each load in the list is a tuple of form (value, start, order, end).
         """
+        if self._removed_loads:
+            # drop the first occurrences of the removed loads in one pass
+            removed = self._removed_loads
+            loads = []
+            for load in self._applied_loads:
+                if removed[load]:
+                    removed[load] -= 1
+                else:
+                    loads.append(load)
+            self._applied_loads = loads
+            self._removed_loads = Counter()
         return self._applied_loads
 
     def _solve_hinge_beams(self, *reactions):
@@ -443,30 +608,35 @@ class Beam:
         else:
             I1 = I2 = I
 
-        load_1 = 0       # Load equation on first segment of composite beam
-        load_2 = 0       # Load equation on second segment of composite beam
+        terms_1 = []     # Load terms on first segment of composite beam
+        terms_2 = []     # Load terms on second segment of composite beam
 
         # Distributing load on both segments
         for load in self.applied_loads:
             if load[1] < l:
-                load_1 += load[0]*SingularityFunction(x, load[1], load[2])
+                terms_1.append(load[0]*SingularityFunction(x, load[1], load[2]))
                 if load[2] == 0:
-                    load_1 -= load[0]*SingularityFunction(x, load[3], load[2])
+                    terms_1.append(-load[0]*SingularityFunction(x, load[3], load[2]))
                 elif load[2] > 0:
-                    load_1 -= load[0]*SingularityFunction(x, load[3], load[2]) + load[0]*SingularityFunction(x, load[3], 0)
+                    terms_1.append(-load[0]*SingularityFunction(x, load[3], load[2]))
+                    terms_1.append(-load[0]*SingularityFunction(x, load[3], 0))
             elif load[1] == l:
-                load_1 += load[0]*SingularityFunction(x, load[1], load[2])
-                load_2 += load[0]*SingularityFunction(x, load[1] - l, load[2])
+                terms_1.append(load[0]*SingularityFunction(x, load[1], load[2]))
+                terms_2.append(load[0]*SingularityFunction(x, load[1] - l, load[2]))
             elif load[1] > l:
-                load_2 += load[0]*SingularityFunction(x, load[1] - l, load[2])
+                terms_2.append(load[0]*SingularityFunction(x, load[1] - l, load[2]))
                 if load[2] == 0:
-                    load_2 -= load[0]*SingularityFunction(x, load[3] - l, load[2])
+                    terms_2.append(-load[0]*SingularityFunction(x, load[3] - l, load[2]))
                 elif load[2] > 0:
-                    load_2 -= load[0]*SingularityFunction(x, load[3] - l, load[2]) + load[0]*SingularityFunction(x, load[3] - l, 0)
+                    terms_2.append(-load[0]*SingularityFunction(x, load[3] - l, load[2]))
+                    terms_2.append(-load[0]*SingularityFunction(x, load[3] - l, 0))
 
         h = Symbol('h')     # Force due to hinge
-        load_1 += h*SingularityFunction(x, l, -1)
-        load_2 -= h*SingularityFunction(x, 0, -1)
+        terms_1.append(h*SingularityFunction(x, l, -1))
+        terms_2.append(-h*SingularityFunction(x, 0, -1))
+
+        load_1 = Add(*terms_1)   # Load equation on first segment of composite beam
+        load_2 = Add(*terms_2)   # Load equation on second segment of composite beam
 
         eq = []
         shear_1 = integrate(load_1, x)
@@ -487,39 +657,52 @@ class Beam:
         C2 = Symbol('C2')
         C3 = Symbol('C3')
         C4 = Symbol('C4')
-        slope_1 = S.One/(E*I1)*(integrate(bending_1, x) + C1)
-        def_1 = S.One/(E*I1)*(integrate((E*I)*slope_1, x) + C1*x + C2)
-        slope_2 = S.One/(E*I2)*(integrate(integrate(integrate(load_2, x), x), x) + C3)
-        def_2 = S.One/(E*I2)*(integrate((E*I)*slope_2, x) + C4)
+        EI_slope_1 = integrate(bending_1, x) + C1
+        EI_slope_2 = integrate(bending_2, x) + C3
+        slope_1 = S.One/(E*I1)*EI_slope_1
+        slope_2 = S.One/(E*I2)*EI_slope_2
+        # With a uniform I, E*I*slope is just the bracket above, so it is
+        # only multiplied back out when I differs between the segments.
+        if isinstance(I, Piecewise):
+            EI_slope_1 = (E*I)*slope_1
+            EI_slope_2 = (E*I)*slope_2
+        def_1 = S.One/(E*I1)*(integrate(EI_slope_1, x) + C1*x + C2)
+        def_2 = S.One/(E*I2)*(integrate(EI_slope_2, x) + C4)
 
         for position, value in self.bc_slope:
             if position<l:
-                eq.append(slope_1.subs(x, position) - value)
+                eq.append(slope_1.xreplace({x: position}) - value)
             else:
-                eq.append(slope_2.subs(x, position - l) - value)
+                eq.append(slope_2.xreplace({x: position - l}) - value)
 
         for position, value in self.bc_deflection:
             if position<l:
-                eq.append(def_1.subs(x, position) - value)
+                eq.append(def_1.xreplace({x: position}) - value)
             else:
-                eq.append(def_2.subs(x, position - l) - value)
+                eq.append(def_2.xreplace({x: position - l}) - value)
 
-        eq.append(def_1.subs(x, l) - def_2.subs(x, 0)) # Deflection of both the segments at hinge would be equal
+        eq.append(def_1.xreplace({x: l}) - def_2.xreplace({x: 0})) # Deflection of both the segments at hinge would be equal
 
-        constants = list(linsolve(eq, C1, C2, C3, C4, h, *reactions))
-        reaction_values = list(constants[0])[5:]
+        constants = _solve_linear(eq, (C1, C2, C3, C4, h) + reactions)
+        reaction_values = list(constants)[5:]
 
         self._reaction_loads = dict(zip(reactions, reaction_values))
-        self._load = self._load.subs(self._reaction_loads)
+        self._load_cache.clear()
 
         # Substituting constants and reactional load and moments with their corresponding values
-        slope_1 = slope_1.subs({C1: constants[0][0], h:constants[0][4]}).subs(self._reaction_loads)
-        def_1 = def_1.subs({C1: constants[0][0], C2: constants[0][1], h:constants[0][4]}).subs(self._reaction_loads)
-        slope_2 = slope_2.subs({x: x-l, C3: constants[0][2], h:constants[0][4]}).subs(self._reaction_loads)
-        def_2 = def_2.subs({x: x-l,C3: constants[0][2], C4: constants[0][3], h:constants[0][4]}).subs(self._reaction_loads)
-
-        self._hinge_beam_slope = slope_1*SingularityFunction(x, 0, 0) - slope_1*SingularityFunction(x, l, 0) + slope_2*SingularityFunction(x, l, 0)
-        self._hinge_beam_deflection = def_1*SingularityFunction(x, 0, 0) - def_1*SingularityFunction(x, l, 0) + def_2*SingularityFunction(x, l, 0)
+        # in one pass per curve; the reactions do not depend on x, so the
+        # x -> x - l shift of the second segment can follow them.
+        subs_map = {C1: constants[0], C2: constants[1], C3: constants[2],
+                    C4: constants[3], h: constants[4], **self._reaction_loads}
+        slope_1 = slope_1.xreplace(subs_map)
+        def_1 = def_1.xreplace(subs_map)
+        slope_2 = slope_2.xreplace(subs_map).subs({x: x-l})
+        def_2 = def_2.xreplace(subs_map).subs({x: x-l})
+
+        sf_0 = SingularityFunction(x, 0, 0)
+        sf_l = SingularityFunction(x, l, 0)
+        self._hinge_beam_slope = slope_1*(sf_0 - sf_l) + slope_2*sf_l
+        self._hinge_beam_deflection = def_1*(sf_0 - sf_l) + def_2*sf_l
 
     def solve_for_reaction_loads(self, *reactions):
         """
@@ -532,70 +715,177 @@ class Beam:
         l = self.length
         C3 = Symbol('C3')
         C4 = Symbol('C4')
+        shear_force = self.shear_force()
+        bending_moment = self.bending_moment()
 
-        shear_curve = limit(self.shear_force(), x, l)
-        moment_curve = limit(self.bending_moment(), x, l)
+        shear_curve = limit(shear_force, x, l)
+        moment_curve = limit(bending_moment, x, l)
 
         slope_eqs = []
         deflection_eqs = []
 
-        slope_curve = integrate(self.bending_moment(), x) + C3
+        slope_curve = integrate(bending_moment, x) + C3
         for position, value in self._boundary_conditions['slope']:
-            eqs = slope_curve.subs(x, position) - value
+            eqs = slope_curve.xreplace({x: position}) - value
             slope_eqs.append(eqs)
 
         deflection_curve = integrate(slope_curve, x) + C4
         for position, value in self._boundary_conditions['deflection']:
-            eqs = deflection_curve.subs(x, position) - value
+            eqs = deflection_curve.xreplace({x: position}) - value
             deflection_eqs.append(eqs)
 
-        solution = list((linsolve([shear_curve, moment_curve] + slope_eqs
-                            + deflection_eqs, (C3, C4) + reactions).args)[0])
+        solution = list(_solve_linear([shear_curve, moment_curve] + slope_eqs
+                            + deflection_eqs, (C3, C4) + reactions))
         solution = solution[2:]
 
         self._reaction_loads = dict(zip(reactions, solution))
-        self._load = self._load.subs(self._reaction_loads)
+        self._load_cache.clear()
 
     def shear_force(self):
         """
         Returns a Singularity Function expression which represents
         the shear force curve of the Beam object.
 
+        """
+        if 'shear_force' not in self._load_cache:
+            x = self.variable
+            self._load_cache['shear_force'] = -integrate(self.load, x)
+        return self._load_cache['shear_force']
+
+    def _piecewise_curve(self, name):
+        """
+        Returns the ``load``, ``shear_force`` or ``bending_moment`` curve
+        rewritten as a single folded Piecewise. The rewrite is cached with
+        the curve it was made from.
+        """
+        key = name + '_piecewise'
+        if key not in self._load_cache:
+            curve = getattr(self, name)
+            if callable(curve):
+                curve = curve()
+            self._load_cache[key] = piecewise_fold(curve.rewrite(Piecewise))
+        return self._load_cache[key]
+
+    def _curve_piece(self, name, start, end):
+        """
+        Returns the expression of the Piecewise ``name`` curve between
+        ``start`` and ``end``, or None if it cannot be told which piece
+        applies there.
+        """
+        curve = self._piecewise_curve(name)
+        if not isinstance(curve, Piecewise):
+            return curve
+        mid = (start + end)/2
+        for expr, cond in curve.args:
+            cond = cond.subs(self.variable, mid)
+            if cond == True:
+                return expr
+            if cond != False:
+                return None
+        return None
+
+    def _interval_roots(self, name, start, end):
+        """
+        Returns the real roots of the ``name`` curve strictly between
+        ``start`` and ``end``, or None if the piece there is not a nonzero
+        polynomial with numeric coefficients.
         """
         x = self.variable
-        return -integrate(self.load, x)
+        piece = self._curve_piece(name, start, end)
+        if piece is None or piece == 0 or piece.free_symbols - {x}:
+            return None
+        try:
+            roots = Poly(piece, x).real_roots()
+        except PolynomialError:
+            return None
+        return [r for r in roots if start < r < end]
+
+    def _numeric_curve(self, name):
+        """
+        Returns a NumPy function of the Piecewise ``name`` curve, or None if
+        NumPy is missing or the curve has symbols other than the variable.
+        """
+        curve = self._piecewise_curve(name)
+        if numpy is None or curve.free_symbols - {self.variable}:
+            return None
+        return _cached_lambdify(curve, self.variable)
+
+    def _interval_extremum(self, curve, curve_fn, points, start, end):
+        """
+        Returns the candidate among the interior ``points`` and the ends of
+        the interval (``start``, ``end``) where ``curve`` has the largest
+        absolute value, along with that value. One vectorized call to
+        ``curve_fn`` drops the candidates that are clearly smaller; the rest
+        are compared exactly, so ties keep the first candidate.
+        """
+        x = self.variable
+        points = points + [start, end]
+        keep = [True]*len(points)
+        if curve_fn is not None:
+            try:
+                eps = float(end - start)*1e-9
+                probes = numpy.array([float(p) for p in points[:-2]]
+                                + [float(start) + eps, float(end) - eps])
+                val = numpy.abs(numpy.broadcast_to(curve_fn(probes), probes.shape))
+            except TypeError:
+                val = None
+            if val is not None and not numpy.isnan(val).any():
+                # Only candidates well below the largest probe are dropped;
+                # the tolerance covers the probes taken next to the ends.
+                keep = list(val >= val.max()*(1 - 1e-6) - 1e-9)
+
+        val = []
+        for i, point in enumerate(points):
+            if not keep[i]:
+                val.append(None)
+            elif i < len(points) - 2:
+                val.append(abs(curve.subs(x, point)))
+            elif i == len(points) - 2:
+                val.append(abs(limit(curve, x, start, '+')))
+            else:
+                val.append(abs(limit(curve, x, end, '-')))
+        max_val = max(v for v in val if v is not None)
+        return points[val.index(max_val)], max_val
 
     def max_shear_force(self):
         """Returns maximum Shear force and its coordinate
         in the Beam object."""
         shear_curve = self.shear_force()
+        load_pw = self._piecewise_curve('load')
+        shear_fn = self._numeric_curve('shear_force')
         x = self.variable
 
-        terms = shear_curve.args
-        singularity = []        # Points at which shear function changes
-        for term in terms:
-            if isinstance(term, Mul):
-                term = term.args[-1]    # SingularityFunction in the term
-            singularity.append(term.args[1])
-        singularity.sort()
-        singularity = list(set(singularity))
+        # Points at which shear function changes, in order along the beam
+        singularity = sorted({sf.args[1] for sf in shear_curve.atoms(SingularityFunction)},
+                                key=default_sort_key)
 
         intervals = []    # List of Intervals with discrete value of shear force
         shear_values = []   # List of values of shear force in each interval
         for i, s in enumerate(singularity):
             if s == 0:
                 continue
+            # A straight or constant piece has its extremes at the ends of
+            # the interval, so there is nothing to solve for.
+            piece = self._curve_piece('shear_force', singularity[i-1], s)
+            if piece is not None and piece.is_polynomial(x) and degree(piece, x) <= 1:
+                if piece.has(x):
+                    point, max_shear = self._interval_extremum(shear_curve, shear_fn,
+                                            [], singularity[i-1], s)
+                    shear_values.append(max_shear)
+                    intervals.append(point)
+                else:
+                    shear_values.append(piece)
+                    intervals.append(Interval(singularity[i-1], s))
+                continue
             try:
-                shear_slope = Piecewise((float("nan"), x<=singularity[i-1]),(self._load.rewrite(Piecewise), x<s), (float("nan"), True))
-                points = solve(shear_slope, x)
-                val = []
-                for point in points:
-                    val.append(abs(shear_curve.subs(x, point)))
-                points.extend([singularity[i-1], s])
-                val += [abs(limit(shear_curve, x, singularity[i-1], '+')), abs(limit(shear_curve, x, s, '-'))]
-                max_shear = max(val)
+                points = self._interval_roots('load', singularity[i-1], s)
+                if points is None:
+                    shear_slope = Piecewise((float("nan"), x<=singularity[i-1]),(load_pw, x<s), (float("nan"), True))
+                    points = solve(shear_slope, x)
+                point, max_shear = self._interval_extremum(shear_curve, shear_fn,
+                                        points, singularity[i-1], s)
                 shear_values.append(max_shear)
-                intervals.append(points[val.index(max_shear)])
+                intervals.append(point)
             # If shear force in a particular Interval has zero or constant
             # slope, then above block gives NotImplementedError as
             # solve can't represent Interval solutions.
@@ -621,40 +911,61 @@ class Beam:
         the bending moment curve of the Beam object.
 
         """
-        x = self.variable
-        return integrate(self.shear_force(), x)
+        if 'bending_moment' not in self._load_cache:
+            x = self.variable
+            self._load_cache['bending_moment'] = integrate(self.shear_force(), x)
+        return self._load_cache['bending_moment']
+
+    def _bending_moment_integral(self):
+        """
+        Antiderivative of the bending moment, shared by the slope and
+        deflection solutions. It only depends on the load, so it is kept
+        while the boundary conditions change.
+        """
+        if 'bending_moment_integral' not in self._load_cache:
+            x = self.variable
+            self._load_cache['bending_moment_integral'] = integrate(self.bending_moment(), x)
+        return self._load_cache['bending_moment_integral']
 
     def max_bmoment(self):
         """Returns maximum Shear force and its coordinate
         in the Beam object."""
         bending_curve = self.bending_moment()
+        shear_pw = self._piecewise_curve('shear_force')
+        bending_fn = self._numeric_curve('bending_moment')
         x = self.variable
 
-        terms = bending_curve.args
-        singularity = []        # Points at which bending moment changes
-        for term in terms:
-            if isinstance(term, Mul):
-                term = term.args[-1]    # SingularityFunction in the term
-            singularity.append(term.args[1])
-        singularity.sort()
-        singularity = list(set(singularity))
+        # Points at which bending moment changes, in order along the beam
+        singularity = sorted({sf.args[1] for sf in bending_curve.atoms(SingularityFunction)},
+                                key=default_sort_key)
 
         intervals = []    # List of Intervals with discrete value of bending moment
         moment_values = []   # List of values of bending moment in each interval
         for i, s in enumerate(singularity):
             if s == 0:
                 continue
+            # A straight or constant piece has its extremes at the ends of
+            # the interval, so there is nothing to solve for.
+            piece = self._curve_piece('bending_moment', singularity[i-1], s)
+            if piece is not None and piece.is_polynomial(x) and degree(piece, x) <= 1:
+                if piece.has(x):
+                    point, max_moment = self._interval_extremum(bending_curve, bending_fn,
+                                            [], singularity[i-1], s)
+                    moment_values.append(max_moment)
+                    intervals.append(point)
+                else:
+                    moment_values.append(piece)
+                    intervals.append(Interval(singularity[i-1], s))
+                continue
             try:
-                moment_slope = Piecewise((float("nan"), x<=singularity[i-1]),(self.shear_force().rewrite(Piecewise), x<s), (float("nan"), True))
-                points = solve(moment_slope, x)
-                val = []
-                for point in points:
-                    val.append(abs(bending_curve.subs(x, point)))
-                points.extend([singularity[i-1], s])
-                val += [abs(limit(bending_curve, x, singularity[i-1], '+')), abs(limit(bending_curve, x, s, '-'))]
-                max_moment = max(val)
+                points = self._interval_roots('shear_force', singularity[i-1], s)
+                if points is None:
+                    moment_slope = Piecewise((float("nan"), x<=singularity[i-1]),(shear_pw, x<s), (float("nan"), True))
+                    points = solve(moment_slope, x)
+                point, max_moment = self._interval_extremum(bending_curve, bending_fn,
+                                        points, singularity[i-1], s)
                 moment_values.append(max_moment)
-                intervals.append(points[val.index(max_moment)])
+                intervals.append(point)
             # If bending moment in a particular Interval has zero or constant
             # slope, then above block gives NotImplementedError as solve
             # can't represent Interval solutions.
@@ -683,52 +994,109 @@ class Beam:
 
         # To restrict the range within length of the Beam
         moment_curve = Piecewise((float("nan"), self.variable<=0),
-                (self.bending_moment(), self.variable<self.length),
+                (self._piecewise_curve('bending_moment'), self.variable<self.length),
                 (float("nan"), True))
 
-        points = solve(moment_curve.rewrite(Piecewise), self.variable,
-                        domain=S.Reals)
+        points = solve(moment_curve, self.variable, domain=S.Reals)
         return points
 
+    @property
+    def _is_piecewise_fixed(self):
+        """
+        Whether the beam is made of segments with different second moments
+        joined by fixed connections, whose slope and deflection are found
+        segment by segment.
+        """
+        return self._composite_type == "fixed" and isinstance(self._second_moment, Piecewise)
+
+    def _curve_key(self, name):
+        """
+        Key under which the ``name`` curve is cached in _load_cache. Along
+        with the load (which clears the cache) these curves depend on the
+        boundary conditions and the beam's stiffness.
+        """
+        return (name, self._composite_type, tuple(self._boundary_conditions['slope']),
+                tuple(self._boundary_conditions['deflection']),
+                self._elastic_modulus, self._second_moment, self._base_char)
+
+    def _composite_slope_deflection(self, sign):
+        """
+        Slope and deflection of a beam joined with fixed connections, whose
+        second moment is a Piecewise over its segments. Both curves are
+        built in one pass over the segments, ``sign`` being the sign given
+        to the integral of the bending moment.
+        """
+        x = self.variable
+        E = self.elastic_modulus
+        I = self.second_moment
+        key = ('composite', sign, E, I)
+        if key in self._load_cache:
+            return self._load_cache[key]
+
+        bending_moment = self.bending_moment()
+        args = I.args
+        prev_slope = 0
+        prev_def = 0
+        prev_end = 0
+        slope_terms = []
+        deflection_terms = []
+        for i in range(len(args)):
+            if i != 0:
+                prev_end = args[i-1][1].args[1]
+            slope_value = sign*S.One/E*integrate(bending_moment/args[i][0], (x, prev_end, x))
+            recent_segment_slope = prev_slope + slope_value
+            deflection_value = integrate(recent_segment_slope, (x, prev_end, x))
+            recent_segment_deflection = prev_def + deflection_value
+            slope_terms.append(recent_segment_slope*SingularityFunction(x, prev_end, 0))
+            deflection_terms.append(recent_segment_deflection*SingularityFunction(x, prev_end, 0))
+            if i != len(args) - 1:
+                slope_terms.append(-(recent_segment_slope*SingularityFunction(x, args[i][1].args[1], 0)))
+                deflection_terms.append(-(recent_segment_deflection*SingularityFunction(x, args[i][1].args[1], 0)))
+            prev_slope = slope_value.subs(x, args[i][1].args[1])
+            prev_def = deflection_value.subs(x, args[i][1].args[1])
+        # Summing all segments at once keeps Add from flattening the
+        # growing curves again on every segment.
+        self._load_cache[key] = (Add(*slope_terms), Add(*deflection_terms))
+        return self._load_cache[key]
+
     def slope(self):
         """
         Returns a Singularity Function expression which represents
         the slope the elastic curve of the Beam object.
         """
+        if self._composite_type == "hinge":
+            return self._hinge_beam_slope
+        key = self._curve_key('slope')
+        if key not in self._load_cache:
+            self._load_cache[key] = self._solve_slope()
+        return self._load_cache[key]
+
+    def _solve_slope(self):
+        """
+        Computes the slope curve of a beam that is not joined by a hinge.
+        """
         x = self.variable
         E = self.elastic_modulus
         I = self.second_moment
+        bending_moment = self.bending_moment()
 
-        if self._composite_type == "hinge":
-            return self._hinge_beam_slope
         if not self._boundary_conditions['slope']:
             return diff(self.deflection(), x)
-        if isinstance(I, Piecewise) and self._composite_type == "fixed":
-            args = I.args
-            slope = 0
-            prev_slope = 0
-            prev_end = 0
-            for i in range(len(args)):
-                if i != 0:
-                    prev_end = args[i-1][1].args[1]
-                slope_value = -S.One/E*integrate(self.bending_moment()/args[i][0], (x, prev_end, x))
-                if i != len(args) - 1:
-                    slope += (prev_slope + slope_value)*SingularityFunction(x, prev_end, 0) - \
-                        (prev_slope + slope_value)*SingularityFunction(x, args[i][1].args[1], 0)
-                else:
-                    slope += (prev_slope + slope_value)*SingularityFunction(x, prev_end, 0)
-                prev_slope = slope_value.subs(x, args[i][1].args[1])
-            return slope
+        if self._is_piecewise_fixed:
+            return self._composite_slope_deflection(-1)[0]
 
         C3 = Symbol('C3')
-        slope_curve = -integrate(S.One/(E*I)*self.bending_moment(), x) + C3
+        if x in (E*I).free_symbols:
+            slope_curve = -integrate(S.One/(E*I)*bending_moment, x) + C3
+        else:
+            slope_curve = -S.One/(E*I)*self._bending_moment_integral() + C3
 
         bc_eqs = []
         for position, value in self._boundary_conditions['slope']:
-            eqs = slope_curve.subs(x, position) - value
+            eqs = slope_curve.xreplace({x: position}) - value
             bc_eqs.append(eqs)
-        constants = list(linsolve(bc_eqs, C3))
-        slope_curve = slope_curve.subs({C3: constants[0][0]})
+        constants = _solve_linear(bc_eqs, (C3,))
+        slope_curve = slope_curve.subs({C3: constants[0]})
         return slope_curve
 
     def deflection(self):
@@ -736,120 +1104,141 @@ class Beam:
         Returns a Singularity Function expression which represents
         the elastic curve or deflection of the Beam object.
         """
+        if self._composite_type == "hinge":
+            return self._hinge_beam_deflection
+        key = self._curve_key('deflection')
+        if key not in self._load_cache:
+            self._load_cache[key] = self._solve_deflection()
+        return self._load_cache[key]
+
+    def _solve_deflection(self):
+        """
+        Computes the deflection curve of a beam that is not joined by a hinge.
+        """
         x = self.variable
         E = self.elastic_modulus
         I = self.second_moment
-        if self._composite_type == "hinge":
-            return self._hinge_beam_deflection
         if not self._boundary_conditions['deflection'] and not self._boundary_conditions['slope']:
-            if isinstance(I, Piecewise) and self._composite_type == "fixed":
-                args = I.args
-                prev_slope = 0
-                prev_def = 0
-                prev_end = 0
-                deflection = 0
-                for i in range(len(args)):
-                    if i != 0:
-                        prev_end = args[i-1][1].args[1]
-                    slope_value = -S.One/E*integrate(self.bending_moment()/args[i][0], (x, prev_end, x))
-                    recent_segment_slope = prev_slope + slope_value
-                    deflection_value = integrate(recent_segment_slope, (x, prev_end, x))
-                    if i != len(args) - 1:
-                        deflection += (prev_def + deflection_value)*SingularityFunction(x, prev_end, 0) \
-                            - (prev_def + deflection_value)*SingularityFunction(x, args[i][1].args[1], 0)
-                    else:
-                        deflection += (prev_def + deflection_value)*SingularityFunction(x, prev_end, 0)
-                    prev_slope = slope_value.subs(x, args[i][1].args[1])
-                    prev_def = deflection_value.subs(x, args[i][1].args[1])
-                return deflection
+            if self._is_piecewise_fixed:
+                return self._composite_slope_deflection(-1)[1]
             base_char = self._base_char
             constants = symbols(base_char + '3:5')
-            return S.One/(E*I)*integrate(-integrate(self.bending_moment(), x), x) + constants[0]*x + constants[1]
+            return S.One/(E*I)*integrate(-self._bending_moment_integral(), x) + constants[0]*x + constants[1]
         elif not self._boundary_conditions['deflection']:
             base_char = self._base_char
             constant = symbols(base_char + '4')
             return integrate(self.slope(), x) + constant
         elif not self._boundary_conditions['slope'] and self._boundary_conditions['deflection']:
-            if isinstance(I, Piecewise) and self._composite_type == "fixed":
-                args = I.args
-                prev_slope = 0
-                prev_def = 0
-                prev_end = 0
-                deflection = 0
-                for i in range(len(args)):
-                    if i != 0:
-                        prev_end = args[i-1][1].args[1]
-                    slope_value = -S.One/E*integrate(self.bending_moment()/args[i][0], (x, prev_end, x))
-                    recent_segment_slope = prev_slope + slope_value
-                    deflection_value = integrate(recent_segment_slope, (x, prev_end, x))
-                    if i != len(args) - 1:
-                        deflection += (prev_def + deflection_value)*SingularityFunction(x, prev_end, 0) \
-                            - (prev_def + deflection_value)*SingularityFunction(x, args[i][1].args[1], 0)
-                    else:
-                        deflection += (prev_def + deflection_value)*SingularityFunction(x, prev_end, 0)
-                    prev_slope = slope_value.subs(x, args[i][1].args[1])
-                    prev_def = deflection_value.subs(x, args[i][1].args[1])
-                return deflection
+            if self._is_piecewise_fixed:
+                return self._composite_slope_deflection(-1)[1]
             base_char = self._base_char
             C3, C4 = symbols(base_char + '3:5')    # Integration constants
-            slope_curve = -integrate(self.bending_moment(), x) + C3
+            slope_curve = -self._bending_moment_integral() + C3
             deflection_curve = integrate(slope_curve, x) + C4
             bc_eqs = []
             for position, value in self._boundary_conditions['deflection']:
-                eqs = deflection_curve.subs(x, position) - value
+                eqs = deflection_curve.xreplace({x: position}) - value
                 bc_eqs.append(eqs)
-            constants = list(linsolve(bc_eqs, (C3, C4)))
-            deflection_curve = deflection_curve.subs({C3: constants[0][0], C4: constants[0][1]})
+            constants = _solve_linear(bc_eqs, (C3, C4))
+            deflection_curve = deflection_curve.subs({C3: constants[0], C4: constants[1]})
             return S.One/(E*I)*deflection_curve
 
-        if isinstance(I, Piecewise) and self._composite_type == "fixed":
-            args = I.args
-            prev_slope = 0
-            prev_def = 0
-            prev_end = 0
-            deflection = 0
-            for i in range(len(args)):
-                if i != 0:
-                    prev_end = args[i-1][1].args[1]
-                slope_value = S.One/E*integrate(self.bending_moment()/args[i][0], (x, prev_end, x))
-                recent_segment_slope = prev_slope + slope_value
-                deflection_value = integrate(recent_segment_slope, (x, prev_end, x))
-                if i != len(args) - 1:
-                    deflection += (prev_def + deflection_value)*SingularityFunction(x, prev_end, 0) \
-                        - (prev_def + deflection_value)*SingularityFunction(x, args[i][1].args[1], 0)
-                else:
-                    deflection += (prev_def + deflection_value)*SingularityFunction(x, prev_end, 0)
-                prev_slope = slope_value.subs(x, args[i][1].args[1])
-                prev_def = deflection_value.subs(x, args[i][1].args[1])
-            return deflection
+        if self._is_piecewise_fixed:
+            return self._composite_slope_deflection(1)[1]
 
         C4 = Symbol('C4')
         deflection_curve = integrate(self.slope(), x) + C4
 
         bc_eqs = []
         for position, value in self._boundary_conditions['deflection']:
-            eqs = deflection_curve.subs(x, position) - value
+            eqs = deflection_curve.xreplace({x: position}) - value
             bc_eqs.append(eqs)
 
-        constants = list(linsolve(bc_eqs, C4))
-        deflection_curve = deflection_curve.subs({C4: constants[0][0]})
+        constants = _solve_linear(bc_eqs, (C4,))
+        deflection_curve = deflection_curve.subs({C4: constants[0]})
         return deflection_curve
 
-    def max_deflection(self):
+    def max_deflection(self, numerical=False):
         """
         Returns point of max deflection and its corresponding deflection value
         in a Beam object.
+
+        Parameters
+        ==========
+
+        numerical : Boolean (default=False)
+            Setting ``numerical=True`` locates the zeros of the slope on a
+            NumPy grid instead of solving for them, and returns the point
+            and value as floats. Beams whose curves still contain symbols
+            other than the variable are always solved exactly.
+        """
+        # The search range depends on the length as well as the curves.
+        key = self._curve_key('max_deflection') + (self._length, numerical)
+        if key not in self._load_cache:
+            result = self._numerical_max_deflection() if numerical else None
+            if result is None:
+                result = self._solve_max_deflection()
+            elif result is False:
+                result = None
+            self._load_cache[key] = result
+        return self._load_cache[key]
+
+    def _numerical_max_deflection(self, num=10000, iterations=60):
+        """
+        Finds the point of max deflection from the sign changes of the slope
+        on a grid of ``num`` points, each refined by bisection. Returns
+        False if no zero lies inside the beam, and None if the curves
+        cannot be evaluated numerically.
+        """
+        x = self.variable
+        length = sympify(self._length)
+        curves = (_as_piecewise(self.slope()), _as_piecewise(self.deflection()))
+        if numpy is None or length.free_symbols or any(curve.free_symbols - {x} for curve in curves):
+            return None
+        f = _numeric(curves, x)
+
+        def slope_at(points):
+            return numpy.broadcast_to(f(points)[0], points.shape).astype(float)
+
+        xs = numpy.linspace(0, float(length), num)
+        ys = slope_at(xs)
+        signs = numpy.sign(ys)
+        # Brackets holding a zero of the slope, all refined together.
+        idx = numpy.nonzero(signs[:-1]*signs[1:] < 0)[0]
+        lo, hi, f_lo = xs[idx], xs[idx + 1], ys[idx]
+        for _ in range(iterations):
+            mid = (lo + hi)/2
+            f_mid = slope_at(mid)
+            left = numpy.sign(f_mid) == numpy.sign(f_lo)
+            lo = numpy.where(left, mid, lo)
+            f_lo = numpy.where(left, f_mid, f_lo)
+            hi = numpy.where(left, hi, mid)
+        points = numpy.concatenate(((lo + hi)/2, xs[1:-1][signs[1:-1] == 0]))
+        # A jump of the slope, as at a hinge, changes its sign without a zero.
+        scale = numpy.nanmax(numpy.abs(ys)) if len(ys) else 0
+        points = points[numpy.abs(slope_at(points)) <= 1e-8*max(scale, 1)]
+        if len(points) == 0:
+            return False
+        deflections = numpy.abs(numpy.broadcast_to(f(points)[1], points.shape).astype(float))
+        i = int(numpy.argmax(deflections))
+        return (float(points[i]), float(deflections[i]))
+
+    def _solve_max_deflection(self):
+        """
+        Finds the point of max deflection by solving for the zeros of the
+        slope within the beam.
         """
+        x = self.variable
 
         # To restrict the range within length of the Beam
-        slope_curve = Piecewise((float("nan"), self.variable<=0),
-                (self.slope(), self.variable<self.length),
+        slope_curve = Piecewise((float("nan"), x<=0),
+                (self.slope(), x<self.length),
                 (float("nan"), True))
 
-        points = solve(slope_curve.rewrite(Piecewise), self.variable,
+        points = solve(slope_curve.rewrite(Piecewise), x,
                         domain=S.Reals)
         deflection_curve = self.deflection()
-        deflections = [deflection_curve.subs(self.variable, x) for x in points]
+        deflections = [deflection_curve.xreplace({x: point}) for point in points]
         deflections = list(map(abs, deflections))
         if len(deflections) != 0:
             max_def = max(deflections)
@@ -862,7 +1251,10 @@ class Beam:
         Returns an expression representing the Shear Stress
         curve of the Beam object.
         """
-        return self.shear_force()/self._area
+        key = ('shear_stress', self._area)
+        if key not in self._load_cache:
+            self._load_cache[key] = self.shear_force()/self._area
+        return self._load_cache[key]
 
     def plot_shear_stress(self, subs=None):
         """
@@ -882,15 +1274,15 @@ class Beam:
 
         if subs is None:
             subs = {}
-        for sym in shear_stress.atoms(Symbol):
-            if sym != x and sym not in subs:
-                raise ValueError('value of %s was not passed.' %sym)
+        missing = _free_symbols(shear_stress) - {x} - set(subs)
+        if missing:
+            raise ValueError('value of %s was not passed.' %_missing_symbol((shear_stress,), x, subs))
 
         if length in subs:
             length = subs[length]
 
         # Returns Plot of Shear Stress
-        return plot (shear_stress.subs(subs), (x, 0, length),
+        return self._plot_curve(_as_piecewise(shear_stress).subs(subs), length,
         title='Shear Stress', xlabel=r'$\mathrm{x}$', ylabel=r'$\tau$',
         line_color='r')
 
@@ -909,16 +1301,15 @@ class Beam:
         shear_force = self.shear_force()
         if subs is None:
             subs = {}
-        for sym in shear_force.atoms(Symbol):
-            if sym == self.variable:
-                continue
-            if sym not in subs:
-                raise ValueError('Value of %s was not passed.' %sym)
+        missing = _free_symbols(shear_force) - {self.variable} - set(subs)
+        if missing:
+            raise ValueError('Value of %s was not passed.'
+                             %_missing_symbol((shear_force,), self.variable, subs))
         if self.length in subs:
             length = subs[self.length]
         else:
             length = self.length
-        return plot(shear_force.subs(subs), (self.variable, 0, length), title='Shear Force',
+        return self._plot_curve(_as_piecewise(shear_force).subs(subs), length, title='Shear Force',
                 xlabel=r'$\mathrm{x}$', ylabel=r'$\mathrm{V}$', line_color='g')
 
     def plot_bending_moment(self, subs=None):
@@ -935,16 +1326,15 @@ class Beam:
         bending_moment = self.bending_moment()
         if subs is None:
             subs = {}
-        for sym in bending_moment.atoms(Symbol):
-            if sym == self.variable:
-                continue
-            if sym not in subs:
-                raise ValueError('Value of %s was not passed.' %sym)
+        missing = _free_symbols(bending_moment) - {self.variable} - set(subs)
+        if missing:
+            raise ValueError('Value of %s was not passed.'
+                             %_missing_symbol((bending_moment,), self.variable, subs))
         if self.length in subs:
             length = subs[self.length]
         else:
             length = self.length
-        return plot(bending_moment.subs(subs), (self.variable, 0, length), title='Bending Moment',
+        return self._plot_curve(_as_piecewise(bending_moment).subs(subs), length, title='Bending Moment',
                 xlabel=r'$\mathrm{x}$', ylabel=r'$\mathrm{M}$', line_color='b')
 
     def plot_slope(self, subs=None):
@@ -961,16 +1351,15 @@ class Beam:
         slope = self.slope()
         if subs is None:
             subs = {}
-        for sym in slope.atoms(Symbol):
-            if sym == self.variable:
-                continue
-            if sym not in subs:
-                raise ValueError('Value of %s was not passed.' %sym)
+        missing = _free_symbols(slope) - {self.variable} - set(subs)
+        if missing:
+            raise ValueError('Value of %s was not passed.'
+                             %_missing_symbol((slope,), self.variable, subs))
         if self.length in subs:
             length = subs[self.length]
         else:
             length = self.length
-        return plot(slope.subs(subs), (self.variable, 0, length), title='Slope',
+        return self._plot_curve(_as_piecewise(slope).subs(subs), length, title='Slope',
                 xlabel=r'$\mathrm{x}$', ylabel=r'$\theta$', line_color='m')
 
     def plot_deflection(self, subs=None):
@@ -987,20 +1376,53 @@ class Beam:
         deflection = self.deflection()
         if subs is None:
             subs = {}
-        for sym in deflection.atoms(Symbol):
-            if sym == self.variable:
-                continue
-            if sym not in subs:
-                raise ValueError('Value of %s was not passed.' %sym)
+        missing = _free_symbols(deflection) - {self.variable} - set(subs)
+        if missing:
+            raise ValueError('Value of %s was not passed.'
+                             %_missing_symbol((deflection,), self.variable, subs))
         if self.length in subs:
             length = subs[self.length]
         else:
             length = self.length
-        return plot(deflection.subs(subs), (self.variable, 0, length),
+        return self._plot_curve(_as_piecewise(deflection).subs(subs), length,
                     title='Deflection', xlabel=r'$\mathrm{x}$', ylabel=r'$\delta$',
                     line_color='r')
 
 
+    def _sample_curves(self, curves, length, num=1000):
+        """
+        Evaluates ``curves``, given in the Piecewise form made by
+        ``_as_piecewise``, on one grid of ``num`` points over the beam
+        through the function built by ``_numeric``, which is kept for
+        curves that are plotted again. Returns the grid and one array per
+        curve, or None if NumPy is missing or the curves still contain
+        symbols other than the beam variable.
+        """
+        x = self.variable
+        if numpy is None or length.free_symbols:
+            return None
+        if any(curve.free_symbols - {x} for curve in curves):
+            return None
+        xs = numpy.linspace(0, float(length), num)
+        values = _numeric(tuple(curves), x)(xs)
+        return xs, [numpy.broadcast_to(value, xs.shape).astype(float) for value in values]
+
+    def _plot_curve(self, curve, length, show=True, **kwargs):
+        """
+        Plots the Piecewise ``curve`` over ``(0, length)`` from a cse
+        lambdified NumPy sampling of it, falling back to ``plot()`` when the curve cannot
+        be sampled numerically.
+        """
+        sampled = self._sample_curves([curve], sympify(length))
+        if sampled is None:
+            return plot(curve, (self.variable, 0, length), show=show, **kwargs)
+        xs, (values,) = sampled
+        line_color = kwargs.pop('line_color', None)
+        curve_plot = plot_factory(List2DSeries(xs, values, line_color=line_color), **kwargs)
+        if show:
+            curve_plot.show()
+        return curve_plot
+
     def plot_loading_results(self, subs=None):
         """
         Returns a subplot of Shear Force, Bending Moment,
@@ -1015,43 +1437,50 @@ class Beam:
         """
         length = self.length
         variable = self.variable
+        curves = (self.shear_force(), self.bending_moment(), self.slope(), self.deflection())
         if subs is None:
             subs = {}
-        for sym in self.deflection().atoms(Symbol):
-            if sym == self.variable:
-                continue
-            if sym not in subs:
-                raise ValueError('Value of %s was not passed.' %sym)
+        missing = frozenset().union(*map(_free_symbols, curves)) - {self.variable} - set(subs)
+        if missing:
+            # the deflection was the only curve checked before, so its
+            # symbols are reported first
+            raise ValueError('Value of %s was not passed.'
+                             %_missing_symbol(curves[3:] + curves[:3], self.variable, subs))
         if length in subs:
             length = subs[length]
-        ax1 = plot(self.shear_force().subs(subs), (variable, 0, length),
-                   title="Shear Force", xlabel=r'$\mathrm{x}$', ylabel=r'$\mathrm{V}$',
-                   line_color='g', show=False)
-        ax2 = plot(self.bending_moment().subs(subs), (variable, 0, length),
-                   title="Bending Moment", xlabel=r'$\mathrm{x}$', ylabel=r'$\mathrm{M}$',
-                   line_color='b', show=False)
-        ax3 = plot(self.slope().subs(subs), (variable, 0, length),
-                   title="Slope", xlabel=r'$\mathrm{x}$', ylabel=r'$\theta$',
-                   line_color='m', show=False)
-        ax4 = plot(self.deflection().subs(subs), (variable, 0, length),
-                   title="Deflection", xlabel=r'$\mathrm{x}$', ylabel=r'$\delta$',
-                   line_color='r', show=False)
-
-        return PlotGrid(4, 1, ax1, ax2, ax3, ax4)
+        curves = [_as_piecewise(curve).subs(subs) for curve in curves]
+        styles = [("Shear Force", r'$\mathrm{V}$', 'g'), ("Bending Moment", r'$\mathrm{M}$', 'b'),
+                  ("Slope", r'$\theta$', 'm'), ("Deflection", r'$\delta$', 'r')]
+
+        # All four curves are sampled on one grid by a single function;
+        # without NumPy each one goes through plot() as before.
+        sampled = self._sample_curves(curves, sympify(length))
+        axes = []
+        for i, (title, ylabel, color) in enumerate(styles):
+            if sampled is None:
+                axes.append(plot(curves[i], (variable, 0, length), title=title,
+                                 xlabel=r'$\mathrm{x}$', ylabel=ylabel, line_color=color, show=False))
+            else:
+                xs, values = sampled
+                axes.append(plot_factory(List2DSeries(xs, values[i], line_color=color),
+                                 title=title, xlabel=r'$\mathrm{x}$', ylabel=ylabel))
+
+        return PlotGrid(4, 1, *axes)
 
     def _solve_for_ild_equations(self):
         """
 
         Helper function for I.L.D. It takes the unsubstituted
         copy of the load equation and uses it to calculate shear force and bending
-        moment equations.
+        moment equations. They are kept with the other load curves, so the
+        reaction, shear and moment I.L.D.s integrate the load only once.
         """
-
-        x = self.variable
-        shear_force = -integrate(self._original_load, x)
-        bending_moment = integrate(shear_force, x)
-
-        return shear_force, bending_moment
+        if 'ild_equations' not in self._load_cache:
+            x = self.variable
+            shear_force = -integrate(self._original_load, x)
+            bending_moment = integrate(shear_force, x)
+            self._load_cache['ild_equations'] = (shear_force, bending_moment)
+        return self._load_cache['ild_equations']
 
     def solve_for_ild_reactions(self, value, *reactions):
         """
@@ -1075,25 +1504,18 @@ class Beam:
         shear_curve = limit(shear_force, x, l) - value
         moment_curve = limit(bending_moment, x, l) - value*(l-x)
 
-        slope_eqs = []
-        deflection_eqs = []
-
         slope_curve = integrate(bending_moment, x) + C3
-        for position, value in self._boundary_conditions['slope']:
-            eqs = slope_curve.subs(x, position) - value
-            slope_eqs.append(eqs)
+        slope_eqs = [slope_curve.xreplace({x: position}) - bc_value
+                     for position, bc_value in self._boundary_conditions['slope']]
 
         deflection_curve = integrate(slope_curve, x) + C4
-        for position, value in self._boundary_conditions['deflection']:
-            eqs = deflection_curve.subs(x, position) - value
-            deflection_eqs.append(eqs)
-
-        solution = list((linsolve([shear_curve, moment_curve] + slope_eqs
-                            + deflection_eqs, (C3, C4) + reactions).args)[0])
-        solution = solution[2:]
+        deflection_eqs = [deflection_curve.xreplace({x: position}) - bc_value
+                          for position, bc_value in self._boundary_conditions['deflection']]
 
         # Determining the equations and solving them.
-        self._ild_reactions = dict(zip(reactions, solution))
+        solution = _solve_linear([shear_curve, moment_curve] + slope_eqs
+                            + deflection_eqs, (C3, C4) + reactions)
+        self._ild_reactions = dict(zip(reactions, solution[2:]))
 
     def plot_ild_reactions(self, subs=None):
         """
@@ -1118,19 +1540,26 @@ class Beam:
         if subs is None:
             subs = {}
 
-        for reaction in self._ild_reactions:
-            for sym in self._ild_reactions[reaction].atoms(Symbol):
-                if sym != x and sym not in subs:
-                    raise ValueError('Value of %s was not passed.' %sym)
-
-        for sym in self._length.atoms(Symbol):
-            if sym != x and sym not in subs:
-                raise ValueError('Value of %s was not passed.' %sym)
-
-        for reaction in self._ild_reactions:
-            ildplots.append(plot(self._ild_reactions[reaction].subs(subs),
-            (x, 0, self._length.subs(subs)), title='I.L.D. for Reactions',
-            xlabel=x, ylabel=reaction, line_color='blue', show=False))
+        missing = frozenset().union(self._length.free_symbols,
+                    *map(_free_symbols, self._ild_reactions.values())) - {x} - set(subs)
+        if missing:
+            raise ValueError('Value of %s was not passed.'
+                             %_missing_symbol((*self._ild_reactions.values(), self._length), x, subs))
+
+        length = self._length.subs(subs)
+        curves = [_as_piecewise(curve).subs(subs) for curve in self._ild_reactions.values()]
+
+        # The reactions share their load terms, so they are sampled together
+        # by one function; without NumPy each one goes through plot().
+        sampled = self._sample_curves(curves, sympify(length))
+        for i, reaction in enumerate(self._ild_reactions):
+            if sampled is None:
+                ildplots.append(plot(curves[i], (x, 0, length), title='I.L.D. for Reactions',
+                xlabel=x, ylabel=reaction, line_color='blue', show=False))
+            else:
+                xs, values = sampled
+                ildplots.append(plot_factory(List2DSeries(xs, values[i], line_color='blue'),
+                title='I.L.D. for Reactions', xlabel=x, ylabel=reaction))
 
         return PlotGrid(len(ildplots), 1, *ildplots)
 
@@ -1191,15 +1620,12 @@ class Beam:
         if subs is None:
             subs = {}
 
-        for sym in self._ild_shear.atoms(Symbol):
-            if sym != x and sym not in subs:
-                raise ValueError('Value of %s was not passed.' %sym)
-
-        for sym in self._length.atoms(Symbol):
-            if sym != x and sym not in subs:
-                raise ValueError('Value of %s was not passed.' %sym)
+        missing = (_free_symbols(self._ild_shear) | self._length.free_symbols) - {x} - set(subs)
+        if missing:
+            raise ValueError('Value of %s was not passed.'
+                             %_missing_symbol((self._ild_shear, self._length), x, subs))
 
-        return plot(self._ild_shear.subs(subs), (x, 0, l),  title='I.L.D. for Shear',
+        return self._plot_curve(_as_piecewise(self._ild_shear).subs(subs), l,  title='I.L.D. for Shear',
                xlabel=r'$\mathrm{X}$', ylabel=r'$\mathrm{V}$', line_color='blue',show=True)
 
     def solve_for_ild_moment(self, distance, value, *reactions):
@@ -1257,14 +1683,11 @@ class Beam:
         if subs is None:
             subs = {}
 
-        for sym in self._ild_moment.atoms(Symbol):
-            if sym != x and sym not in subs:
-                raise ValueError('Value of %s was not passed.' %sym)
-
-        for sym in self._length.atoms(Symbol):
-            if sym != x and sym not in subs:
-                raise ValueError('Value of %s was not passed.' %sym)
-        return plot(self._ild_moment.subs(subs), (x, 0, self._length), title='I.L.D. for Moment',
+        missing = (_free_symbols(self._ild_moment) | self._length.free_symbols) - {x} - set(subs)
+        if missing:
+            raise ValueError('Value of %s was not passed.'
+                             %_missing_symbol((self._ild_moment, self._length), x, subs))
+        return self._plot_curve(_as_piecewise(self._ild_moment).subs(subs), self._length, title='I.L.D. for Moment',
                xlabel=r'$\mathrm{X}$', ylabel=r'$\mathrm{M}$', line_color='blue', show=True)
 
     @doctest_depends_on(modules=('numpy',))
@@ -1376,25 +1799,6 @@ class Beam:
                                 scaled_load -= (f2.diff(x, i).subs(x, end - start)*
                                                SingularityFunction(x, end, i)/factorial(i))
 
-                    if pictorial:
-                        if isinstance(scaled_load, Add):
-                            load_args = scaled_load.args
-                        else:
-                            # when the load equation consists of only a single term
-                            load_args = (scaled_load,)
-                        load_eq = [i.subs(l) for i in load_args]
-                    else:
-                        if isinstance(self.load, Add):
-                            load_args = self.load.args
-                        else:
-                            load_args = (self.load,)
-                        load_eq = [i.subs(l) for i in load_args if list(i.atoms(SingularityFunction))[0].args[2] >= 0]
-                    load_eq = Add(*load_eq)
-
-                    # filling higher order loads with colour
-                    expr = height + load_eq.rewrite(Piecewise)
-                    y1 = lambdify(x, expr, 'numpy')
-
                 # For loads with negative value
                 else:
                     minus = 1
@@ -1409,34 +1813,56 @@ class Beam:
                                 scaled_load1 -= (f2.diff(x, i).subs(x, end - start)*
                                                SingularityFunction(x, end, i)/factorial(i))
 
-                    if pictorial:
-                        if isinstance(scaled_load1, Add):
-                            load_args1 = scaled_load1.args
-                        else:
-                            # when the load equation consists of only a single term
-                            load_args1 = (scaled_load1,)
-                        load_eq1 = [i.subs(l) for i in load_args1]
-                    else:
-                        if isinstance(self.load, Add):
-                            load_args1 = self.load.args1
-                        else:
-                            load_args1 = (self.load,)
-                        load_eq1 = [i.subs(l) for i in load_args if list(i.atoms(SingularityFunction))[0].args[2] >= 0]
-                    load_eq1 = -Add(*load_eq1)-height
-
-                    # filling higher order loads with colour
-                    expr = height + load_eq1.rewrite(Piecewise)
-                    y1_ = lambdify(x, expr, 'numpy')
-
-                y = numpy.arange(0, float(length), 0.001)
-                y2 = float(height)
-
-                if(plus == 1 and minus == 1):
-                    fill = {'x': y, 'y1': y1(y), 'y2': y1_(y), 'color':'darkkhaki'}
-                elif(plus == 1):
-                    fill = {'x': y, 'y1': y1(y), 'y2': y2, 'color':'darkkhaki'}
+        # The load equations only depend on the accumulated loads, so they
+        # are built once all of them have been added up.
+        if plus == 1:
+            if pictorial:
+                if isinstance(scaled_load, Add):
+                    load_args = scaled_load.args
+                else:
+                    # when the load equation consists of only a single term
+                    load_args = (scaled_load,)
+                load_eq = [i.subs(l) for i in load_args]
+            else:
+                if isinstance(self.load, Add):
+                    load_args = self.load.args
                 else:
-                    fill = {'x': y, 'y1': y1_(y), 'y2': y2, 'color':'darkkhaki'}
+                    load_args = (self.load,)
+                load_eq = [i.subs(l) for i in load_args if list(i.atoms(SingularityFunction))[0].args[2] >= 0]
+            load_eq = Add(*load_eq)
+
+        if minus == 1:
+            if pictorial:
+                if isinstance(scaled_load1, Add):
+                    load_args1 = scaled_load1.args
+                else:
+                    # when the load equation consists of only a single term
+                    load_args1 = (scaled_load1,)
+                load_eq1 = [i.subs(l) for i in load_args1]
+            else:
+                if isinstance(self.load, Add):
+                    load_args1 = self.load.args1
+                else:
+                    load_args1 = (self.load,)
+                load_eq1 = [i.subs(l) for i in load_args if list(i.atoms(SingularityFunction))[0].args[2] >= 0]
+            load_eq1 = -Add(*load_eq1)-height
+
+        # filling higher order loads with colour, once the load equations
+        # are complete, on a single grid shared by both of them
+        if plus == 1 or minus == 1:
+            y = numpy.arange(0, float(length), 0.001)
+            y2 = float(height)
+            if plus == 1:
+                y1, = _numeric((height + load_eq.rewrite(Piecewise),), x)(y)
+            if minus == 1:
+                y1_, = _numeric((height + load_eq1.rewrite(Piecewise),), x)(y)
+
+            if(plus == 1 and minus == 1):
+                fill = {'x': y, 'y1': y1, 'y2': y1_, 'color':'darkkhaki'}
+            elif(plus == 1):
+                fill = {'x': y, 'y1': y1, 'y2': y2, 'color':'darkkhaki'}
+            else:
+                fill = {'x': y, 'y1': y1_, 'y2': y2, 'color':'darkkhaki'}
         return annotations, markers, load_eq, load_eq1, fill
 
 